@@ -0,0 +1,15 @@
+"""Shared helpers for the API routers."""
+
+from typing import NoReturn
+
+from fastapi import HTTPException
+
+
+def command_failed_detail(message: str) -> dict:
+    """Build a command_failed error detail without a pydantic round-trip."""
+    return {"error": "command_failed", "message": message, "retry_after": 5}
+
+
+def raise_command_failed(message: str) -> NoReturn:
+    """Raise the canonical 503 for a write the device rejected."""
+    raise HTTPException(status_code=503, detail=command_failed_detail(message))
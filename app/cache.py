@@ -0,0 +1,113 @@
+"""Short-TTL cache for serial read commands.
+
+Device state changes on human timescale, but probes and a polling UI can
+issue many duplicate reads per second. Caching each read command's result
+for a short window turns O(requests) serial round-trips into O(requests /
+TTL). Writes invalidate the reads they affect so the next GET sees fresh
+state.
+"""
+
+import asyncio
+import time
+
+import structlog
+
+from app.commands import PARSERS, Commands
+from app.serial_handler import SerialHandler
+
+log = structlog.get_logger()
+
+# (success, response, error) as returned by SerialHandler.send_command.
+SendResult = tuple[bool, str | None, str | None]
+
+_DEFAULT_TTL = 1.0
+
+_entries: dict[str, tuple[float, SendResult]] = {}
+_locks: dict[str, asyncio.Lock] = {}
+
+
+async def cached_send(
+    handler: SerialHandler, command: str, ttl: float = _DEFAULT_TTL
+) -> SendResult:
+    """Send a read command, serving a cached result while it is fresh.
+
+    A per-command lock makes concurrent callers wait on a single device
+    read instead of stampeding the serial port with duplicates.
+    """
+    entry = _entries.get(command)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    lock = _locks.setdefault(command, asyncio.Lock())
+    async with lock:
+        entry = _entries.get(command)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        result = await handler.send_command(command)
+        if result[0]:
+            _entries[command] = (time.monotonic() + ttl, result)
+        return result
+
+
+async def send_and_parse(handler: SerialHandler, command: str, ttl: float = _DEFAULT_TTL):
+    """Send a read command and return its parsed value, or None on failure."""
+    success, response, _ = await cached_send(handler, command, ttl)
+    if success and response:
+        return PARSERS[command](response)
+    return None
+
+
+def invalidate(*commands: str) -> None:
+    """Drop cached results for the given commands."""
+    for command in commands:
+        _entries.pop(command, None)
+
+
+def clear() -> None:
+    """Drop every cached result (used by tests and reconnect paths)."""
+    _entries.clear()
+
+
+# The reads a polling UI touches on every cycle. The refresh loop keeps
+# these warm so GET endpoints answer from memory between ticks.
+_HOT_COMMANDS: tuple[str, ...] = (
+    Commands.GET_POWER,
+    Commands.GET_MULTIVIEW,
+    Commands.GET_ALL_WINDOWS_INPUT,
+    Commands.GET_OUTPUT_RES,
+    Commands.GET_OUTPUT_HDCP,
+    Commands.GET_OUTPUT_ITC,
+    Commands.GET_OUTPUT_VKA,
+    Commands.GET_AUDIO_SOURCE,
+    Commands.GET_AUDIO_VOL,
+    Commands.GET_AUDIO_MUTE,
+)
+
+_REFRESH_INTERVAL = 2.0
+
+
+async def refresh_loop(
+    handler: SerialHandler,
+    commands: tuple[str, ...] = _HOT_COMMANDS,
+    interval: float = _REFRESH_INTERVAL,
+) -> None:
+    """Periodically re-read the hot commands into the cache.
+
+    Entries are written with a TTL that outlives the tick, so a fresh
+    result is always resident and read endpoints decouple from serial
+    round-trip latency: the port sees one poll cycle per interval instead
+    of one transaction per HTTP request. Device-side changes (front-panel
+    buttons) surface within one tick.
+    """
+    ttl = interval + _DEFAULT_TTL
+    while True:
+        try:
+            if handler.is_connected:
+                for command in commands:
+                    invalidate(command)
+                    await cached_send(handler, command, ttl=ttl)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.warning("cache_refresh_error", error=str(e))
+        await asyncio.sleep(interval)
@@ -1,10 +1,12 @@
 """RS-232 command definitions and response parsers."""
 
 import re
-from enum import IntEnum
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, Final, Generic, TypeVar
 
 
-class MultiviewMode(IntEnum):
+class MultiviewMode:
     """Multiview display modes."""
 
     SINGLE = 1
@@ -14,7 +16,7 @@ class MultiviewMode(IntEnum):
     QUAD = 5
 
 
-class AudioSource(IntEnum):
+class AudioSource:
     """Audio source options."""
 
     FOLLOW_WINDOW_1 = 0
@@ -24,7 +26,7 @@ class AudioSource(IntEnum):
     HDMI_4 = 4
 
 
-class HDMIInput(IntEnum):
+class HDMIInput:
     """HDMI input options."""
 
     HDMI_1 = 1
@@ -33,7 +35,7 @@ class HDMIInput(IntEnum):
     HDMI_4 = 4
 
 
-class PIPPosition(IntEnum):
+class PIPPosition:
     """PIP window positions."""
 
     LEFT_TOP = 1
@@ -42,7 +44,7 @@ class PIPPosition(IntEnum):
     RIGHT_BOTTOM = 4
 
 
-class PIPSize(IntEnum):
+class PIPSize:
     """PIP window sizes."""
 
     SMALL = 1
@@ -50,7 +52,7 @@ class PIPSize(IntEnum):
     LARGE = 3
 
 
-class OutputResolution(IntEnum):
+class OutputResolution:
     """Output resolution options."""
 
     RES_4096x2160p60 = 1
@@ -69,25 +71,39 @@ class OutputResolution(IntEnum):
     RES_1024x768p60 = 14
 
 
-RESOLUTION_NAMES = {
-    OutputResolution.RES_4096x2160p60: "4096x2160p60",
-    OutputResolution.RES_4096x2160p50: "4096x2160p50",
-    OutputResolution.RES_3840x2160p60: "3840x2160p60",
-    OutputResolution.RES_3840x2160p50: "3840x2160p50",
-    OutputResolution.RES_3840x2160p30: "3840x2160p30",
-    OutputResolution.RES_3840x2160p25: "3840x2160p25",
-    OutputResolution.RES_1920x1200p60RB: "1920x1200p60RB",
-    OutputResolution.RES_1920x1080p60: "1920x1080p60",
-    OutputResolution.RES_1920x1080p50: "1920x1080p50",
-    OutputResolution.RES_1360x768p60: "1360x768p60",
-    OutputResolution.RES_1280x800p60: "1280x800p60",
-    OutputResolution.RES_1280x720p60: "1280x720p60",
-    OutputResolution.RES_1280x720p50: "1280x720p50",
-    OutputResolution.RES_1024x768p60: "1024x768p60",
-}
-
-
-class HDCPMode(IntEnum):
+# Resolution names indexed by OutputResolution value - 1; the values form
+# a compact 1..14 range, so a tuple index beats a dict probe.
+RESOLUTION_NAME_TABLE: tuple[str, ...] = (
+    "4096x2160p60",
+    "4096x2160p50",
+    "3840x2160p60",
+    "3840x2160p50",
+    "3840x2160p30",
+    "3840x2160p25",
+    "1920x1200p60RB",
+    "1920x1080p60",
+    "1920x1080p50",
+    "1360x768p60",
+    "1280x800p60",
+    "1280x720p60",
+    "1280x720p50",
+    "1024x768p60",
+)
+
+# Mapping view kept for callers that look names up by raw value.
+RESOLUTION_NAMES = {index + 1: name for index, name in enumerate(RESOLUTION_NAME_TABLE)}
+
+# API-facing names for the other 1-based device setting values, matching
+# what the response parsers return for the same fields.
+HDCP_NAME_TABLE: tuple[str, ...] = ("hdcp_1_4", "hdcp_2_2", "off")
+VIDEO_MODE_NAME_TABLE: tuple[str, ...] = ("video", "pc")
+VKA_NAME_TABLE: tuple[str, ...] = ("black_screen", "blue_screen")
+ASPECT_NAME_TABLE: tuple[str, ...] = ("full_screen", "16_9")
+PIP_POSITION_NAME_TABLE: tuple[str, ...] = ("left_top", "left_bottom", "right_top", "right_bottom")
+PIP_SIZE_NAME_TABLE: tuple[str, ...] = ("small", "middle", "large")
+
+
+class HDCPMode:
     """HDCP mode options."""
 
     HDCP_1_4 = 1
@@ -95,28 +111,28 @@ class HDCPMode(IntEnum):
     HDCP_OFF = 3
 
 
-class VideoMode(IntEnum):
+class VideoMode:
     """Video mode (ITC) options."""
 
     VIDEO_MODE = 1
     PC_MODE = 2
 
 
-class VKAPattern(IntEnum):
+class VKAPattern:
     """Video keep active pattern options."""
 
     BLACK_SCREEN = 1
     BLUE_SCREEN = 2
 
 
-class PBPMode(IntEnum):
+class PBPMode:
     """PBP display modes."""
 
     MODE_1 = 1
     MODE_2 = 2
 
 
-class AspectRatio(IntEnum):
+class AspectRatio:
     """Aspect ratio options."""
 
     FULL_SCREEN = 1
@@ -198,177 +214,319 @@ class Commands:
     SET_QUAD_ASPECT = "s quad aspect {x}!"
     GET_QUAD_ASPECT = "r quad aspect!"
 
-
-# Response parsers
-class ResponseParser:
-    """Parse device responses into structured data."""
-
-    @staticmethod
-    def parse_power(response: str) -> bool | None:
-        """Parse power state response."""
-        if "power on" in response.lower():
-            return True
-        if "power off" in response.lower():
-            return False
+    # Pre-bound %-format callables for the parametric templates above.
+    # Calling these skips re-parsing the format string on every request;
+    # FMT_SET_WINDOW_INPUT takes a (window, input) tuple.
+    FMT_SET_OUTPUT_RES = "s output res %d!".__mod__
+    FMT_SET_OUTPUT_HDCP = "s output hdcp %d!".__mod__
+    FMT_SET_OUTPUT_VKA = "s output vka %d!".__mod__
+    FMT_SET_OUTPUT_ITC = "s output itc %d!".__mod__
+    FMT_SET_AUDIO_SOURCE = "s output audio %d!".__mod__
+    FMT_SET_AUDIO_VOL = "s output audio vol %d!".__mod__
+    FMT_SET_AUDIO_MUTE = "s output audio mute %d!".__mod__
+    FMT_SET_INPUT_SOURCE = "s in source %d!".__mod__
+    FMT_SET_MULTIVIEW = "s multiview %d!".__mod__
+    FMT_SET_WINDOW_INPUT = "s window %d in %d!".__mod__
+    FMT_GET_WINDOW_INPUT = "r window %d in!".__mod__
+    FMT_SET_PIP_POSITION = "s PIP position %d!".__mod__
+    FMT_SET_PIP_SIZE = "s PIP size %d!".__mod__
+    FMT_SET_PBP_MODE = "s PBP mode %d!".__mod__
+    FMT_SET_PBP_ASPECT = "s PBP aspect %d!".__mod__
+    FMT_SET_TRIPLE_MODE = "s triple mode %d!".__mod__
+    FMT_SET_TRIPLE_ASPECT = "s triple aspect %d!".__mod__
+    FMT_SET_QUAD_MODE = "s quad mode %d!".__mod__
+    FMT_SET_QUAD_ASPECT = "s quad aspect %d!".__mod__
+
+
+# Wire-format cache. The serial handler writes ascii bytes terminated by
+# CRLF; encoding each distinct command once removes the str.encode call
+# from every send. Parametric commands funnel through the same cache —
+# the device vocabulary is small enough that every variant stays resident.
+@lru_cache(maxsize=256)
+def encode_command(command: str) -> bytes:
+    """Return the CRLF-terminated ascii wire form of a command."""
+    return command.rstrip("\r\n").encode("ascii") + b"\r\n"
+
+
+# Response parsing tables and precompiled patterns.
+# The tables map lowercase needles from device replies to parsed values;
+# insertion order doubles as match priority.
+# Value-extracting responses ("output audio volume: 50", "out resolution:
+# 3840x2160p60") are split on their fixed label instead of a regex search:
+# a find plus slice avoids the match-object allocation on every parse.
+_VOLUME_LABEL = "volume:"
+_RESOLUTION_LABEL = "resolution:"
+
+_POWER_TABLE: dict[str, bool] = {"power on": True, "power off": False}
+_MULTIVIEW_TABLE: dict[str, str] = {
+    "single": "single",
+    "pip": "pip",
+    "pbp": "pbp",
+    "triple": "triple",
+    "quad": "quad",
+}
+_MUTE_TABLE: dict[str, bool] = {"mute: on": True, "mute: off": False}
+_HDCP_TABLE: dict[str, str] = {"hdcp 1.4": "hdcp_1_4", "hdcp 2.2": "hdcp_2_2", "hdcp off": "off"}
+_VIDEO_MODE_TABLE: dict[str, str] = {"video mode": "video", "pc mode": "pc"}
+_PIP_POSITION_TABLE: dict[str, str] = {
+    "left top": "left_top",
+    "left bottom": "left_bottom",
+    "right top": "right_top",
+    "right bottom": "right_bottom",
+}
+_PIP_SIZE_TABLE: dict[str, str] = {"small": "small", "middle": "middle", "large": "large"}
+_PBP_MODE_TABLE: dict[str, int] = {"mode 1": 1, "mode 2": 2}
+_ASPECT_TABLE: dict[str, str] = {"full": "full_screen", "16:9": "16_9"}
+_VKA_TABLE: dict[str, str] = {"black": "black_screen", "blue": "blue_screen"}
+_AUTO_SWITCH_TABLE: dict[str, bool] = {"auto switch on": True, "auto switch off": False}
+
+_T = TypeVar("_T")
+
+
+class _NeedleScanner(Generic[_T]):
+    """Single-pass multi-needle matcher for a parse table.
+
+    Compiles the table needles into one alternation pattern at import time
+    so a response is scanned once instead of once per needle. Ties at the
+    same position resolve in table order. An optional guard substring,
+    common to every needle, cheaply rejects unrelated responses before
+    the pattern runs.
+    """
+
+    __slots__ = ("_guard", "_pattern", "_values")
+
+    def __init__(self, table: dict[str, _T], guard: str | None = None) -> None:
+        self._pattern = re.compile("|".join(re.escape(needle) for needle in table))
+        self._values = table
+        self._guard = guard
+
+    def scan(self, response: str) -> _T | None:
+        """Return the value for the first needle found in the response."""
+        low = response.lower()
+        if self._guard is not None and self._guard not in low:
+            return None
+        match = self._pattern.search(low)
+        if match:
+            return self._values[match.group(0)]
         return None
 
-    @staticmethod
-    def parse_multiview_mode(response: str) -> str | None:
-        """Parse multiview mode response."""
-        response_lower = response.lower()
-        if "single" in response_lower:
-            return "single"
-        if "pip" in response_lower:
-            return "pip"
-        if "pbp" in response_lower:
-            return "pbp"
-        if "triple" in response_lower:
-            return "triple"
-        if "quad" in response_lower:
-            return "quad"
-        return None
 
-    @staticmethod
-    def parse_audio_source(response: str) -> int | None:
-        """Parse audio source response."""
-        response_lower = response.lower()
-        if "follow" in response_lower:
-            return 0
-        if "hdmi 1" in response_lower:
-            return 1
-        if "hdmi 2" in response_lower:
-            return 2
-        if "hdmi 3" in response_lower:
-            return 3
-        if "hdmi 4" in response_lower:
-            return 4
-        return None
+_POWER_SCANNER = _NeedleScanner(_POWER_TABLE, guard="power")
+_MULTIVIEW_SCANNER = _NeedleScanner(_MULTIVIEW_TABLE)
+_MUTE_SCANNER = _NeedleScanner(_MUTE_TABLE, guard="mute")
+_HDCP_SCANNER = _NeedleScanner(_HDCP_TABLE)
+_VIDEO_MODE_SCANNER = _NeedleScanner(_VIDEO_MODE_TABLE)
+_PIP_POSITION_SCANNER = _NeedleScanner(_PIP_POSITION_TABLE)
+_PIP_SIZE_SCANNER = _NeedleScanner(_PIP_SIZE_TABLE)
+_PBP_MODE_SCANNER = _NeedleScanner(_PBP_MODE_TABLE, guard="mode")
+_ASPECT_SCANNER = _NeedleScanner(_ASPECT_TABLE)
+_VKA_SCANNER = _NeedleScanner(_VKA_TABLE)
+_AUTO_SWITCH_SCANNER = _NeedleScanner(_AUTO_SWITCH_TABLE, guard="auto switch")
 
-    @staticmethod
-    def parse_volume(response: str) -> int | None:
-        """Parse volume response."""
-        match = re.search(r"volume:\s*(\d+)", response, re.IGNORECASE)
-        if match:
-            return int(match.group(1))
-        return None
+# HDMI input references share one digit-capture pattern instead of a
+# four-needle alternation; the capture goes straight to int.
+_HDMI_INPUT_RE = re.compile(r"hdmi\s*([1-4])", re.IGNORECASE)
 
-    @staticmethod
-    def parse_mute(response: str) -> bool | None:
-        """Parse mute state response."""
-        if "mute: on" in response.lower():
-            return True
-        if "mute: off" in response.lower():
-            return False
-        return None
 
-    @staticmethod
-    def parse_resolution(response: str) -> str | None:
-        """Parse resolution response."""
-        match = re.search(r"resolution:\s*(.+)", response, re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-        return None
+def _scan_hdmi_input(response: str) -> int | None:
+    """Extract the HDMI input number (1-4) from a response, if present."""
+    match = _HDMI_INPUT_RE.search(response)
+    return int(match.group(1)) if match else None
 
-    @staticmethod
-    def parse_hdcp(response: str) -> str | None:
-        """Parse HDCP response."""
-        response_lower = response.lower()
-        if "hdcp 1.4" in response_lower:
-            return "hdcp_1_4"
-        if "hdcp 2.2" in response_lower:
-            return "hdcp_2_2"
-        if "hdcp off" in response_lower:
-            return "off"
-        return None
 
-    @staticmethod
-    def parse_video_mode(response: str) -> str | None:
-        """Parse video mode (ITC) response."""
-        response_lower = response.lower()
-        if "video mode" in response_lower:
-            return "video"
-        if "pc mode" in response_lower:
-            return "pc"
-        return None
+# Device responses are drawn from a small fixed vocabulary, so each parser
+# memoizes by response text: repeat inputs resolve with a dict hit instead
+# of a rescan. maxsize=64 comfortably covers every response shape the
+# UHD-401MV emits.
+@lru_cache(maxsize=64)
+def parse_power(response: str) -> bool | None:
+    """Parse power state response."""
+    return _POWER_SCANNER.scan(response)
 
-    @staticmethod
-    def parse_window_input(response: str) -> int | None:
-        """Parse window input selection response."""
-        response_lower = response.lower()
-        if "hdmi 1" in response_lower:
-            return 1
-        if "hdmi 2" in response_lower:
-            return 2
-        if "hdmi 3" in response_lower:
-            return 3
-        if "hdmi 4" in response_lower:
-            return 4
-        return None
 
-    @staticmethod
-    def parse_pip_position(response: str) -> str | None:
-        """Parse PIP position response."""
-        response_lower = response.lower()
-        if "left top" in response_lower:
-            return "left_top"
-        if "left bottom" in response_lower:
-            return "left_bottom"
-        if "right top" in response_lower:
-            return "right_top"
-        if "right bottom" in response_lower:
-            return "right_bottom"
-        return None
+@lru_cache(maxsize=64)
+def parse_multiview_mode(response: str) -> str | None:
+    """Parse multiview mode response."""
+    return _MULTIVIEW_SCANNER.scan(response)
 
-    @staticmethod
-    def parse_pip_size(response: str) -> str | None:
-        """Parse PIP size response."""
-        response_lower = response.lower()
-        if "small" in response_lower:
-            return "small"
-        if "middle" in response_lower:
-            return "middle"
-        if "large" in response_lower:
-            return "large"
-        return None
 
-    @staticmethod
-    def parse_pbp_mode(response: str) -> int | None:
-        """Parse PBP mode response."""
-        if "mode 1" in response.lower():
-            return 1
-        if "mode 2" in response.lower():
-            return 2
-        return None
+@lru_cache(maxsize=64)
+def parse_audio_source(response: str) -> int | None:
+    """Parse audio source response."""
+    if "follow" in response.lower():
+        return 0
+    return _scan_hdmi_input(response)
 
-    @staticmethod
-    def parse_aspect(response: str) -> str | None:
-        """Parse aspect ratio response."""
-        response_lower = response.lower()
-        if "full" in response_lower:
-            return "full_screen"
-        if "16:9" in response_lower:
-            return "16_9"
-        return None
 
-    @staticmethod
-    def parse_input_source(response: str) -> int | None:
-        """Parse single screen input source response."""
-        response_lower = response.lower()
-        if "hdmi 1" in response_lower:
-            return 1
-        if "hdmi 2" in response_lower:
-            return 2
-        if "hdmi 3" in response_lower:
-            return 3
-        if "hdmi 4" in response_lower:
-            return 4
-        return None
+@lru_cache(maxsize=64)
+def parse_volume(response: str) -> int | None:
+    """Parse volume response."""
+    rest = response.lower().partition(_VOLUME_LABEL)[2].lstrip()
+    end = 0
+    while end < len(rest) and rest[end].isdigit():
+        end += 1
+    if end:
+        return int(rest[:end])
+    return None
 
-    @staticmethod
-    def parse_auto_switch(response: str) -> bool | None:
-        """Parse auto switch response."""
-        if "auto switch on" in response.lower():
-            return True
-        if "auto switch off" in response.lower():
-            return False
-        return None
+
+@lru_cache(maxsize=64)
+def parse_mute(response: str) -> bool | None:
+    """Parse mute state response."""
+    return _MUTE_SCANNER.scan(response)
+
+
+def parse_audio_state(
+    source_response: str | None,
+    volume_response: str | None,
+    mute_response: str | None,
+) -> tuple[int | None, int | None, bool | None]:
+    """Parse the three audio query responses in one call.
+
+    Accepts None for any response that failed, returning None for
+    that field, so callers can feed send_command results straight in.
+    """
+    source = parse_audio_source(source_response) if source_response else None
+    volume = parse_volume(volume_response) if volume_response else None
+    muted = parse_mute(mute_response) if mute_response else None
+    return source, volume, muted
+
+
+@lru_cache(maxsize=64)
+def parse_resolution(response: str) -> str | None:
+    """Parse resolution response."""
+    # Find the label case-insensitively but slice the value out of the
+    # original string: the device reports mixed-case names like
+    # 1920x1200p60RB and callers expect that casing preserved.
+    index = response.lower().find(_RESOLUTION_LABEL)
+    if index != -1:
+        value = response[index + len(_RESOLUTION_LABEL) :].strip()
+        return value or None
+    return None
+
+
+@lru_cache(maxsize=64)
+def parse_hdcp(response: str) -> str | None:
+    """Parse HDCP response."""
+    return _HDCP_SCANNER.scan(response)
+
+
+@lru_cache(maxsize=64)
+def parse_video_mode(response: str) -> str | None:
+    """Parse video mode (ITC) response."""
+    return _VIDEO_MODE_SCANNER.scan(response)
+
+
+@lru_cache(maxsize=64)
+def parse_window_input(response: str) -> int | None:
+    """Parse window input selection response."""
+    return _scan_hdmi_input(response)
+
+
+_WINDOW_LINE_RE = re.compile(r"window\s*([1-4])\D+?hdmi\s*([1-4])", re.IGNORECASE)
+
+
+@lru_cache(maxsize=8)
+def parse_all_window_inputs(response: str) -> tuple[tuple[int, int], ...]:
+    """Parse the bulk "r window 0 in!" response into (window, input) pairs."""
+    return tuple(
+        (int(match.group(1)), int(match.group(2))) for match in _WINDOW_LINE_RE.finditer(response)
+    )
+
+
+@lru_cache(maxsize=64)
+def parse_pip_position(response: str) -> str | None:
+    """Parse PIP position response."""
+    return _PIP_POSITION_SCANNER.scan(response)
+
+
+@lru_cache(maxsize=64)
+def parse_pip_size(response: str) -> str | None:
+    """Parse PIP size response."""
+    return _PIP_SIZE_SCANNER.scan(response)
+
+
+@lru_cache(maxsize=64)
+def parse_pbp_mode(response: str) -> int | None:
+    """Parse PBP mode response."""
+    return _PBP_MODE_SCANNER.scan(response)
+
+
+@lru_cache(maxsize=64)
+def parse_aspect(response: str) -> str | None:
+    """Parse aspect ratio response."""
+    return _ASPECT_SCANNER.scan(response)
+
+
+@lru_cache(maxsize=64)
+def parse_input_source(response: str) -> int | None:
+    """Parse single screen input source response."""
+    return _scan_hdmi_input(response)
+
+
+@lru_cache(maxsize=64)
+def parse_vka(response: str) -> str | None:
+    """Parse VKA (video keep active) pattern response."""
+    return _VKA_SCANNER.scan(response)
+
+
+@lru_cache(maxsize=64)
+def parse_auto_switch(response: str) -> bool | None:
+    """Parse auto switch response."""
+    return _AUTO_SWITCH_SCANNER.scan(response)
+
+
+class ResponseParser:
+    """Namespace view over the module-level parser functions.
+
+    Kept for importers and tests; new code should call the functions
+    directly to skip the class attribute lookup.
+    """
+
+    parse_power = staticmethod(parse_power)
+    parse_multiview_mode = staticmethod(parse_multiview_mode)
+    parse_audio_source = staticmethod(parse_audio_source)
+    parse_volume = staticmethod(parse_volume)
+    parse_mute = staticmethod(parse_mute)
+    parse_audio_state = staticmethod(parse_audio_state)
+    parse_resolution = staticmethod(parse_resolution)
+    parse_hdcp = staticmethod(parse_hdcp)
+    parse_video_mode = staticmethod(parse_video_mode)
+    parse_window_input = staticmethod(parse_window_input)
+    parse_all_window_inputs = staticmethod(parse_all_window_inputs)
+    parse_pip_position = staticmethod(parse_pip_position)
+    parse_pip_size = staticmethod(parse_pip_size)
+    parse_pbp_mode = staticmethod(parse_pbp_mode)
+    parse_aspect = staticmethod(parse_aspect)
+    parse_input_source = staticmethod(parse_input_source)
+    parse_vka = staticmethod(parse_vka)
+    parse_auto_switch = staticmethod(parse_auto_switch)
+
+
+# Read command -> parser dispatch. Callers go through this (see
+# app.cache.send_and_parse) instead of pairing each send with an inline
+# parse, which normalizes None-on-failure handling in one place.
+PARSERS: Final[dict[str, Callable[[str], Any]]] = {
+    Commands.GET_POWER: parse_power,
+    Commands.GET_TYPE: str.strip,
+    Commands.GET_FW_VERSION: str.strip,
+    Commands.GET_MULTIVIEW: parse_multiview_mode,
+    Commands.GET_ALL_WINDOWS_INPUT: parse_all_window_inputs,
+    Commands.GET_INPUT_SOURCE: parse_input_source,
+    Commands.GET_AUTO_SWITCH: parse_auto_switch,
+    Commands.GET_AUDIO_SOURCE: parse_audio_source,
+    Commands.GET_AUDIO_VOL: parse_volume,
+    Commands.GET_AUDIO_MUTE: parse_mute,
+    Commands.GET_OUTPUT_RES: parse_resolution,
+    Commands.GET_OUTPUT_HDCP: parse_hdcp,
+    Commands.GET_OUTPUT_ITC: parse_video_mode,
+    Commands.GET_OUTPUT_VKA: parse_vka,
+    Commands.GET_PIP_POSITION: parse_pip_position,
+    Commands.GET_PIP_SIZE: parse_pip_size,
+    Commands.GET_PBP_MODE: parse_pbp_mode,
+    Commands.GET_PBP_ASPECT: parse_aspect,
+    Commands.GET_TRIPLE_MODE: parse_pbp_mode,
+    Commands.GET_TRIPLE_ASPECT: parse_aspect,
+    Commands.GET_QUAD_MODE: parse_pbp_mode,
+    Commands.GET_QUAD_ASPECT: parse_aspect,
+}
@@ -1,35 +1,82 @@
 """Application dependencies and shared state."""
 
+import time
 from datetime import UTC, datetime
 
-from app.serial_handler import SerialHandler
+from fastapi import HTTPException
 
-# Global state
-_serial_handler: SerialHandler | None = None
+from app.serial_handler import ConnectionState, SerialHandler
+
+# Global state. The handler sits in a single-element list so hot paths can
+# read _handler_box[0] directly instead of paying a function call plus
+# None-check on every request; get_serial_handler stays as the checked
+# accessor for startup-sensitive callers and tests.
+_handler_box: list[SerialHandler | None] = [None]
 _startup_time: datetime | None = None
+# Monotonic reading taken alongside the wall-clock startup time; uptime is
+# a single float subtraction instead of datetime arithmetic per probe.
+_startup_monotonic = time.monotonic()
 
 
 def set_serial_handler(handler: SerialHandler) -> None:
     """Set the global serial handler instance."""
-    global _serial_handler
-    _serial_handler = handler
+    _handler_box[0] = handler
 
 
 def get_serial_handler() -> SerialHandler:
     """Get the serial handler instance."""
-    if _serial_handler is None:
+    handler = _handler_box[0]
+    if handler is None:
         raise RuntimeError("Serial handler not initialized")
-    return _serial_handler
+    return handler
+
+
+# How long a positive availability check stays fresh. Within the window,
+# bursts of requests (and endpoint chains that re-check) skip the handler
+# state comparison entirely.
+_AVAILABILITY_TTL = 0.25
+_last_available = 0.0
+
+_UNAVAILABLE_DETAIL = {
+    "error": "device_unavailable",
+    "message": "Serial device not connected",
+    "retry_after": 5,
+}
+
 
+def require_available_handler() -> SerialHandler:
+    """Dependency: the connected handler, or a 503 if the device is gone.
 
-def set_startup_time(time: datetime) -> None:
+    Endpoints take this via Depends() so FastAPI resolves the guard and
+    the handler lookup once per request instead of each endpoint pairing
+    an availability check with get_serial_handler().
+    """
+    global _last_available
+    handler = _handler_box[0]
+    if handler is not None:
+        now = time.monotonic()
+        if now - _last_available < _AVAILABILITY_TTL:
+            return handler
+        if handler.state != ConnectionState.UNAVAILABLE:
+            _last_available = now
+            return handler
+    raise HTTPException(status_code=503, detail=_UNAVAILABLE_DETAIL)
+
+
+def set_startup_time(startup: datetime) -> None:
     """Set the application startup time."""
-    global _startup_time
-    _startup_time = time
+    global _startup_time, _startup_monotonic
+    _startup_time = startup
+    _startup_monotonic = time.monotonic()
 
 
 def get_startup_time() -> datetime:
-    """Get the application startup time."""
+    """Get the application startup time (wall clock, for logging)."""
     if _startup_time is None:
         return datetime.now(UTC)
     return _startup_time
+
+
+def get_startup_monotonic() -> float:
+    """Get the monotonic clock reading captured at startup."""
+    return _startup_monotonic
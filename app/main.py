@@ -1,13 +1,16 @@
 """FastAPI application entry point."""
 
+import asyncio
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from datetime import UTC, datetime
 
 import structlog
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app import __version__
+from app.cache import refresh_loop
 from app.config import settings
 from app.dependencies import set_serial_handler, set_startup_time
 from app.routers import audio, display, health, output, system
@@ -55,10 +58,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Start the serial handler
     await serial_handler.start()
 
+    # Keep the hot read commands warm so GETs answer from the cache
+    refresh_task = asyncio.create_task(refresh_loop(serial_handler))
+
     yield
 
     # Cleanup
     log.info("shutting_down_application")
+    refresh_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await refresh_task
     await serial_handler.stop()
 
 
@@ -67,6 +76,7 @@ app = FastAPI(
     description="REST API for controlling UHD-401MV multiviewer via RS-232",
     version=__version__,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Include routers
@@ -277,18 +277,26 @@ class SetTripleQuadRequest(BaseModel):
     aspect: int | None = Field(None, ge=1, le=2, description="1=full_screen, 2=16:9")
 
 
-# Mappings for friendly names
-AUDIO_SOURCE_NAMES = {
-    0: "follow_window_1",
-    1: "hdmi_1",
-    2: "hdmi_2",
-    3: "hdmi_3",
-    4: "hdmi_4",
-}
-
-INPUT_NAMES = {
-    1: "hdmi_1",
-    2: "hdmi_2",
-    3: "hdmi_3",
-    4: "hdmi_4",
-}
+# Reverse lookup tables precomputed at import. Indexing these skips the
+# EnumMeta.__call__ machinery that Enum(value) runs on every coercion.
+MULTIVIEW_MODE_BY_VALUE = {mode.value: mode for mode in MultiviewModeEnum}
+
+CONNECTION_STATE_BY_VALUE = {state.value: state for state in ConnectionState}
+
+
+# Friendly-name tables indexed by the compact device value ranges
+# (audio sources 0-4, HDMI inputs 1-4).
+AUDIO_SOURCE_NAME_TABLE: tuple[str, ...] = (
+    "follow_window_1",
+    "hdmi_1",
+    "hdmi_2",
+    "hdmi_3",
+    "hdmi_4",
+)
+
+INPUT_NAME_TABLE: tuple[str, ...] = ("hdmi_1", "hdmi_2", "hdmi_3", "hdmi_4")
+
+# Mapping views kept for callers that look names up by raw value.
+AUDIO_SOURCE_NAMES = dict(enumerate(AUDIO_SOURCE_NAME_TABLE))
+
+INPUT_NAMES = {index + 1: name for index, name in enumerate(INPUT_NAME_TABLE)}
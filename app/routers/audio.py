@@ -1,71 +1,77 @@
 """Audio endpoints: source, volume, mute."""
 
-from fastapi import APIRouter, HTTPException
+import asyncio
 
-from app.commands import Commands, ResponseParser
-from app.dependencies import get_serial_handler
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
+
+from app._router_utils import raise_command_failed
+from app.cache import cached_send, invalidate
+from app.commands import Commands, parse_audio_state, parse_mute, parse_volume
+from app.dependencies import require_available_handler
 from app.models import (
-    AUDIO_SOURCE_NAMES,
+    AUDIO_SOURCE_NAME_TABLE,
     AudioResponse,
-    ErrorResponse,
     SetAudioSourceRequest,
     SetMuteRequest,
     SetVolumeRequest,
 )
-from app.serial_handler import ConnectionState
+from app.serial_handler import SerialHandler
 
 router = APIRouter()
 
 
-def _check_device_available() -> None:
-    """Check if device is available, raise HTTPException if not."""
-    handler = get_serial_handler()
-    if handler.state == ConnectionState.UNAVAILABLE:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="device_unavailable",
-                message="Serial device not connected",
-                retry_after=5,
-            ).model_dump(),
-        )
+# Last known audio state. GETs refresh it in full; successful setters fold
+# their own value in so write endpoints answer without re-querying the
+# device for state they just wrote.
+_audio_state: dict = {"source": None, "volume": None, "muted": None}
 
 
-@router.get("/audio", response_model=AudioResponse)
-async def get_audio() -> AudioResponse:
-    """Get current audio settings (source, volume, mute)."""
-    _check_device_available()
-    handler = get_serial_handler()
+def _audio_response() -> AudioResponse:
+    """Build an AudioResponse from the cached state."""
+    source = _audio_state["source"]
+    return AudioResponse.model_construct(
+        source=source,
+        source_name=AUDIO_SOURCE_NAME_TABLE[source] if source is not None else None,
+        volume=_audio_state["volume"],
+        muted=_audio_state["muted"],
+    )
 
-    source = None
-    volume = None
-    muted = None
 
-    # Get audio source
-    success, response, _ = await handler.send_command(Commands.GET_AUDIO_SOURCE)
-    if success and response:
-        source = ResponseParser.parse_audio_source(response)
+async def _refresh_volume(handler: SerialHandler) -> AudioResponse:
+    """Re-read only the volume after a relative step and answer from cache."""
+    # Drop the stale entry first: the refresh loop keeps GET_AUDIO_VOL
+    # permanently fresh, so without this the re-read would report the
+    # pre-step volume.
+    invalidate(Commands.GET_AUDIO_VOL)
+    _, volume_response, _ = await cached_send(handler, Commands.GET_AUDIO_VOL)
+    if volume_response:
+        _audio_state["volume"] = parse_volume(volume_response)
+    return _audio_response()
 
-    # Get volume
-    success, response, _ = await handler.send_command(Commands.GET_AUDIO_VOL)
-    if success and response:
-        volume = ResponseParser.parse_volume(response)
 
-    # Get mute state
-    success, response, _ = await handler.send_command(Commands.GET_AUDIO_MUTE)
-    if success and response:
-        muted = ResponseParser.parse_mute(response)
+@router.get("/audio", response_model=AudioResponse)
+async def get_audio(handler: SerialHandler = Depends(require_available_handler)) -> ORJSONResponse:
+    """Get current audio settings (source, volume, mute)."""
 
-    return AudioResponse(
-        source=source,
-        source_name=AUDIO_SOURCE_NAMES.get(source) if source is not None else None,
-        volume=volume,
-        muted=muted,
+    (_, source_response, _), (_, volume_response, _), (_, mute_response, _) = await asyncio.gather(
+        cached_send(handler, Commands.GET_AUDIO_SOURCE),
+        cached_send(handler, Commands.GET_AUDIO_VOL),
+        cached_send(handler, Commands.GET_AUDIO_MUTE),
     )
 
+    source, volume, muted = parse_audio_state(source_response, volume_response, mute_response)
+    _audio_state.update(source=source, volume=volume, muted=muted)
+
+    # Serialize the already-validated model directly; response_model would
+    # re-validate it through a second construction pass.
+    return ORJSONResponse(_audio_response().model_dump(mode="json"))
+
 
 @router.post("/audio/source", response_model=AudioResponse)
-async def set_audio_source(request: SetAudioSourceRequest) -> AudioResponse:
+async def set_audio_source(
+    request: SetAudioSourceRequest, handler: SerialHandler = Depends(require_available_handler)
+) -> AudioResponse:
     """
     Set audio source.
 
@@ -75,139 +81,99 @@ async def set_audio_source(request: SetAudioSourceRequest) -> AudioResponse:
     - 3: HDMI 3 input audio
     - 4: HDMI 4 input audio
     """
-    _check_device_available()
-    handler = get_serial_handler()
 
-    command = Commands.SET_AUDIO_SOURCE.format(x=request.source)
+    command = Commands.FMT_SET_AUDIO_SOURCE(request.source)
     success, response, error = await handler.send_command(command)
 
     if not success:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="command_failed",
-                message=error or "Failed to set audio source",
-                retry_after=5,
-            ).model_dump(),
-        )
+        raise_command_failed(error or "Failed to set audio source")
 
-    # Get full audio state
-    return await get_audio()
+    _audio_state["source"] = request.source
+    invalidate(Commands.GET_AUDIO_SOURCE)
+    return _audio_response()
 
 
 @router.post("/audio/volume", response_model=AudioResponse)
-async def set_audio_volume(request: SetVolumeRequest) -> AudioResponse:
+async def set_audio_volume(
+    request: SetVolumeRequest, handler: SerialHandler = Depends(require_available_handler)
+) -> AudioResponse:
     """Set audio volume (0-100)."""
-    _check_device_available()
-    handler = get_serial_handler()
 
-    command = Commands.SET_AUDIO_VOL.format(x=request.volume)
+    command = Commands.FMT_SET_AUDIO_VOL(request.volume)
     success, response, error = await handler.send_command(command)
 
     if not success:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="command_failed",
-                message=error or "Failed to set audio volume",
-                retry_after=5,
-            ).model_dump(),
-        )
+        raise_command_failed(error or "Failed to set audio volume")
 
-    # Get full audio state
-    return await get_audio()
+    _audio_state["volume"] = request.volume
+    invalidate(Commands.GET_AUDIO_VOL)
+    return _audio_response()
 
 
 @router.post("/audio/volume/up", response_model=AudioResponse)
-async def increase_volume() -> AudioResponse:
+async def increase_volume(
+    handler: SerialHandler = Depends(require_available_handler),
+) -> AudioResponse:
     """Increase audio volume by one step."""
-    _check_device_available()
-    handler = get_serial_handler()
 
     success, response, error = await handler.send_command(Commands.AUDIO_VOL_UP)
 
     if not success:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="command_failed",
-                message=error or "Failed to increase volume",
-                retry_after=5,
-            ).model_dump(),
-        )
+        raise_command_failed(error or "Failed to increase volume")
 
-    return await get_audio()
+    return await _refresh_volume(handler)
 
 
 @router.post("/audio/volume/down", response_model=AudioResponse)
-async def decrease_volume() -> AudioResponse:
+async def decrease_volume(
+    handler: SerialHandler = Depends(require_available_handler),
+) -> AudioResponse:
     """Decrease audio volume by one step."""
-    _check_device_available()
-    handler = get_serial_handler()
 
     success, response, error = await handler.send_command(Commands.AUDIO_VOL_DOWN)
 
     if not success:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="command_failed",
-                message=error or "Failed to decrease volume",
-                retry_after=5,
-            ).model_dump(),
-        )
+        raise_command_failed(error or "Failed to decrease volume")
 
-    return await get_audio()
+    return await _refresh_volume(handler)
 
 
 @router.post("/audio/mute", response_model=AudioResponse)
-async def set_audio_mute(request: SetMuteRequest) -> AudioResponse:
+async def set_audio_mute(
+    request: SetMuteRequest, handler: SerialHandler = Depends(require_available_handler)
+) -> AudioResponse:
     """Set audio mute state."""
-    _check_device_available()
-    handler = get_serial_handler()
 
     mute_value = 1 if request.muted else 0
-    command = Commands.SET_AUDIO_MUTE.format(x=mute_value)
+    command = Commands.FMT_SET_AUDIO_MUTE(mute_value)
     success, response, error = await handler.send_command(command)
 
     if not success:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="command_failed",
-                message=error or "Failed to set mute state",
-                retry_after=5,
-            ).model_dump(),
-        )
+        raise_command_failed(error or "Failed to set mute state")
 
-    return await get_audio()
+    _audio_state["muted"] = request.muted
+    invalidate(Commands.GET_AUDIO_MUTE)
+    return _audio_response()
 
 
 @router.post("/audio/mute/toggle", response_model=AudioResponse)
-async def toggle_mute() -> AudioResponse:
+async def toggle_mute(handler: SerialHandler = Depends(require_available_handler)) -> AudioResponse:
     """Toggle audio mute state."""
-    _check_device_available()
-    handler = get_serial_handler()
 
     # Get current mute state
-    success, response, _ = await handler.send_command(Commands.GET_AUDIO_MUTE)
+    success, response, _ = await cached_send(handler, Commands.GET_AUDIO_MUTE)
     current_muted = False
     if success and response:
-        current_muted = ResponseParser.parse_mute(response) or False
+        current_muted = parse_mute(response) or False
 
     # Toggle
     new_mute_value = 0 if current_muted else 1
-    command = Commands.SET_AUDIO_MUTE.format(x=new_mute_value)
+    command = Commands.FMT_SET_AUDIO_MUTE(new_mute_value)
     success, response, error = await handler.send_command(command)
 
     if not success:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="command_failed",
-                message=error or "Failed to toggle mute",
-                retry_after=5,
-            ).model_dump(),
-        )
-
-    return await get_audio()
+        raise_command_failed(error or "Failed to toggle mute")
+
+    _audio_state["muted"] = not current_muted
+    invalidate(Commands.GET_AUDIO_MUTE)
+    return _audio_response()
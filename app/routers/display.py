@@ -1,12 +1,24 @@
 """Display endpoints: multiview mode, window routing, PIP/PBP settings."""
 
-from fastapi import APIRouter, HTTPException, Path
-
-from app.commands import Commands, ResponseParser
-from app.dependencies import get_serial_handler
+import asyncio
+from typing import Final
+
+from fastapi import APIRouter, Depends, Path
+from fastapi.responses import ORJSONResponse
+
+from app._router_utils import raise_command_failed
+from app.cache import cached_send, invalidate, send_and_parse
+from app.commands import (
+    ASPECT_NAME_TABLE,
+    PIP_POSITION_NAME_TABLE,
+    PIP_SIZE_NAME_TABLE,
+    Commands,
+    parse_window_input,
+)
+from app.dependencies import require_available_handler
 from app.models import (
-    INPUT_NAMES,
-    ErrorResponse,
+    INPUT_NAME_TABLE,
+    MULTIVIEW_MODE_BY_VALUE,
     InputSourceResponse,
     MultiviewModeEnum,
     MultiviewRequest,
@@ -22,118 +34,109 @@ from app.models import (
     WindowInput,
     WindowsResponse,
 )
-from app.serial_handler import ConnectionState
+from app.serial_handler import SerialHandler
 
 router = APIRouter()
 
 
-def _check_device_available() -> None:
-    """Check if device is available, raise HTTPException if not."""
-    handler = get_serial_handler()
-    if handler.state == ConnectionState.UNAVAILABLE:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="device_unavailable",
-                message="Serial device not connected",
-                retry_after=5,
-            ).model_dump(),
-        )
+# Mode -> command value, hoisted so set_multiview does not rebuild it per
+# request.
+_MODE_MAP: Final = {
+    MultiviewModeEnum.SINGLE: 1,
+    MultiviewModeEnum.PIP: 2,
+    MultiviewModeEnum.PBP: 3,
+    MultiviewModeEnum.TRIPLE: 4,
+    MultiviewModeEnum.QUAD: 5,
+}
 
 
 # Multiview mode endpoints
 @router.get("/multiview", response_model=MultiviewResponse)
-async def get_multiview() -> MultiviewResponse:
+async def get_multiview(
+    handler: SerialHandler = Depends(require_available_handler),
+) -> ORJSONResponse:
     """Get current multiview display mode."""
-    _check_device_available()
-    handler = get_serial_handler()
 
-    success, response, _ = await handler.send_command(Commands.GET_MULTIVIEW)
-    mode = None
-    if success and response:
-        mode_str = ResponseParser.parse_multiview_mode(response)
-        if mode_str:
-            mode = MultiviewModeEnum(mode_str)
+    mode_str = await send_and_parse(handler, Commands.GET_MULTIVIEW)
+    mode = MULTIVIEW_MODE_BY_VALUE[mode_str] if mode_str else None
 
-    return MultiviewResponse(mode=mode)
+    return ORJSONResponse(MultiviewResponse.model_construct(mode=mode).model_dump(mode="json"))
 
 
 @router.post("/multiview", response_model=MultiviewResponse)
-async def set_multiview(request: MultiviewRequest) -> MultiviewResponse:
+async def set_multiview(
+    request: MultiviewRequest, handler: SerialHandler = Depends(require_available_handler)
+) -> MultiviewResponse:
     """Set multiview display mode."""
-    _check_device_available()
-    handler = get_serial_handler()
-
-    # Map mode to command value
-    mode_map = {
-        MultiviewModeEnum.SINGLE: 1,
-        MultiviewModeEnum.PIP: 2,
-        MultiviewModeEnum.PBP: 3,
-        MultiviewModeEnum.TRIPLE: 4,
-        MultiviewModeEnum.QUAD: 5,
-    }
-
-    command = Commands.SET_MULTIVIEW.format(x=mode_map[request.mode])
+
+    command = Commands.FMT_SET_MULTIVIEW(_MODE_MAP[request.mode])
     success, response, error = await handler.send_command(command)
 
     if not success:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="command_failed",
-                message=error or "Failed to set multiview mode",
-                retry_after=5,
-            ).model_dump(),
-        )
+        raise_command_failed(error or "Failed to set multiview mode")
 
-    return MultiviewResponse(mode=request.mode)
+    invalidate(Commands.GET_MULTIVIEW)
+    return MultiviewResponse.model_construct(mode=request.mode)
 
 
 # Window input routing endpoints
 @router.get("/windows", response_model=WindowsResponse)
-async def get_windows() -> WindowsResponse:
+async def get_windows(
+    handler: SerialHandler = Depends(require_available_handler),
+) -> ORJSONResponse:
     """Get all window-to-input mappings."""
-    _check_device_available()
-    handler = get_serial_handler()
+
+    # One bulk query ("window 0") returns all four mappings in a single
+    # serial round-trip; fall back to per-window reads if the device
+    # answers with nothing parseable.
+    pairs = await send_and_parse(handler, Commands.GET_ALL_WINDOWS_INPUT)
+    mapping: dict[int, int] = dict(pairs) if pairs else {}
+
+    if not mapping:
+        results = await asyncio.gather(
+            *(
+                cached_send(handler, Commands.FMT_GET_WINDOW_INPUT(window_id))
+                for window_id in range(1, 5)
+            )
+        )
+        for window_id, (success, response, _) in enumerate(results, start=1):
+            if success and response:
+                input_num = parse_window_input(response)
+                if input_num:
+                    mapping[window_id] = input_num
 
     windows = []
     for window_id in range(1, 5):
-        command = Commands.GET_WINDOW_INPUT.format(x=window_id)
-        success, response, _ = await handler.send_command(command)
-        input_num = None
-        if success and response:
-            input_num = ResponseParser.parse_window_input(response)
-
+        input_num = mapping.get(window_id)
         windows.append(
-            WindowInput(
+            WindowInput.model_construct(
                 window=window_id,
                 input=input_num or 0,
-                input_name=INPUT_NAMES.get(input_num) if input_num else None,
+                input_name=INPUT_NAME_TABLE[input_num - 1] if input_num else None,
             )
         )
 
-    return WindowsResponse(windows=windows)
+    return ORJSONResponse(WindowsResponse.model_construct(windows=windows).model_dump(mode="json"))
 
 
 @router.get("/windows/{window_id}", response_model=WindowInput)
 async def get_window_input(
     window_id: int = Path(ge=1, le=4, description="Window ID (1-4)"),
+    handler: SerialHandler = Depends(require_available_handler),
 ) -> WindowInput:
     """Get input source for a specific window."""
-    _check_device_available()
-    handler = get_serial_handler()
 
-    command = Commands.GET_WINDOW_INPUT.format(x=window_id)
-    success, response, _ = await handler.send_command(command)
+    command = Commands.FMT_GET_WINDOW_INPUT(window_id)
+    success, response, _ = await cached_send(handler, command)
 
     input_num = None
     if success and response:
-        input_num = ResponseParser.parse_window_input(response)
+        input_num = parse_window_input(response)
 
-    return WindowInput(
+    return WindowInput.model_construct(
         window=window_id,
         input=input_num or 0,
-        input_name=INPUT_NAMES.get(input_num) if input_num else None,
+        input_name=INPUT_NAME_TABLE[input_num - 1] if input_num else None,
     )
 
 
@@ -141,310 +144,267 @@ async def get_window_input(
 async def set_window_input(
     request: SetWindowInputRequest,
     window_id: int = Path(ge=1, le=4, description="Window ID (1-4)"),
+    handler: SerialHandler = Depends(require_available_handler),
 ) -> WindowInput:
     """Set input source for a specific window."""
-    _check_device_available()
-    handler = get_serial_handler()
 
-    command = Commands.SET_WINDOW_INPUT.format(x=window_id, y=request.input)
+    command = Commands.FMT_SET_WINDOW_INPUT((window_id, request.input))
     success, response, error = await handler.send_command(command)
 
     if not success:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="command_failed",
-                message=error or "Failed to set window input",
-                retry_after=5,
-            ).model_dump(),
-        )
+        raise_command_failed(error or "Failed to set window input")
 
-    return WindowInput(
+    invalidate(Commands.GET_ALL_WINDOWS_INPUT, Commands.FMT_GET_WINDOW_INPUT(window_id))
+    return WindowInput.model_construct(
         window=window_id,
         input=request.input,
-        input_name=INPUT_NAMES.get(request.input),
+        input_name=INPUT_NAME_TABLE[request.input - 1],
     )
 
 
 # Single screen mode endpoints
 @router.get("/input", response_model=InputSourceResponse)
-async def get_input_source() -> InputSourceResponse:
+async def get_input_source(
+    handler: SerialHandler = Depends(require_available_handler),
+) -> InputSourceResponse:
     """Get current input source (single screen mode)."""
-    _check_device_available()
-    handler = get_serial_handler()
 
-    success, response, _ = await handler.send_command(Commands.GET_INPUT_SOURCE)
-    input_num = None
-    if success and response:
-        input_num = ResponseParser.parse_input_source(response)
+    input_num = await send_and_parse(handler, Commands.GET_INPUT_SOURCE)
 
-    return InputSourceResponse(
+    return InputSourceResponse.model_construct(
         input=input_num,
-        input_name=INPUT_NAMES.get(input_num) if input_num else None,
+        input_name=INPUT_NAME_TABLE[input_num - 1] if input_num else None,
     )
 
 
 @router.post("/input", response_model=InputSourceResponse)
-async def set_input_source(request: SetInputSourceRequest) -> InputSourceResponse:
+async def set_input_source(
+    request: SetInputSourceRequest, handler: SerialHandler = Depends(require_available_handler)
+) -> InputSourceResponse:
     """Set input source (single screen mode)."""
-    _check_device_available()
-    handler = get_serial_handler()
 
-    command = Commands.SET_INPUT_SOURCE.format(x=request.input)
+    command = Commands.FMT_SET_INPUT_SOURCE(request.input)
     success, response, error = await handler.send_command(command)
 
     if not success:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="command_failed",
-                message=error or "Failed to set input source",
-                retry_after=5,
-            ).model_dump(),
-        )
+        raise_command_failed(error or "Failed to set input source")
 
-    return InputSourceResponse(
+    invalidate(Commands.GET_INPUT_SOURCE)
+    return InputSourceResponse.model_construct(
         input=request.input,
-        input_name=INPUT_NAMES.get(request.input),
+        input_name=INPUT_NAME_TABLE[request.input - 1],
     )
 
 
 # PIP settings endpoints
 @router.get("/pip", response_model=PIPResponse)
-async def get_pip_settings() -> PIPResponse:
+async def get_pip_settings(
+    handler: SerialHandler = Depends(require_available_handler),
+) -> PIPResponse:
     """Get PIP window settings."""
-    _check_device_available()
-    handler = get_serial_handler()
 
-    position = None
-    size = None
-
-    success, response, _ = await handler.send_command(Commands.GET_PIP_POSITION)
-    if success and response:
-        position = ResponseParser.parse_pip_position(response)
-
-    success, response, _ = await handler.send_command(Commands.GET_PIP_SIZE)
-    if success and response:
-        size = ResponseParser.parse_pip_size(response)
+    position, size = await asyncio.gather(
+        send_and_parse(handler, Commands.GET_PIP_POSITION),
+        send_and_parse(handler, Commands.GET_PIP_SIZE),
+    )
 
-    return PIPResponse(position=position, size=size)
+    return PIPResponse.model_construct(position=position, size=size)
 
 
 @router.post("/pip", response_model=PIPResponse)
-async def set_pip_settings(request: SetPIPRequest) -> PIPResponse:
+async def set_pip_settings(
+    request: SetPIPRequest, handler: SerialHandler = Depends(require_available_handler)
+) -> PIPResponse:
     """Set PIP window settings."""
-    _check_device_available()
-    handler = get_serial_handler()
-
-    position = None
-    size = None
 
+    # Both writes ride one batch so the pair costs a single lock handoff.
+    commands = []
+    failure_messages = []
     if request.position is not None:
-        command = Commands.SET_PIP_POSITION.format(x=request.position)
-        success, response, error = await handler.send_command(command)
-        if not success:
-            raise HTTPException(
-                status_code=503,
-                detail=ErrorResponse(
-                    error="command_failed",
-                    message=error or "Failed to set PIP position",
-                    retry_after=5,
-                ).model_dump(),
-            )
-        position = ResponseParser.parse_pip_position(response) if response else None
-
+        commands.append(Commands.FMT_SET_PIP_POSITION(request.position))
+        failure_messages.append("Failed to set PIP position")
     if request.size is not None:
-        command = Commands.SET_PIP_SIZE.format(x=request.size)
-        success, response, error = await handler.send_command(command)
-        if not success:
-            raise HTTPException(
-                status_code=503,
-                detail=ErrorResponse(
-                    error="command_failed",
-                    message=error or "Failed to set PIP size",
-                    retry_after=5,
-                ).model_dump(),
-            )
-        size = ResponseParser.parse_pip_size(response) if response else None
+        commands.append(Commands.FMT_SET_PIP_SIZE(request.size))
+        failure_messages.append("Failed to set PIP size")
 
-    # Get current settings if not set
-    if position is None:
-        success, response, _ = await handler.send_command(Commands.GET_PIP_POSITION)
-        if success and response:
-            position = ResponseParser.parse_pip_position(response)
+    if commands:
+        results = await handler.send_command_batch(commands)
+        for (success, _, error), message in zip(results, failure_messages, strict=True):
+            if not success:
+                raise_command_failed(error or message)
 
-    if size is None:
-        success, response, _ = await handler.send_command(Commands.GET_PIP_SIZE)
-        if success and response:
-            size = ResponseParser.parse_pip_size(response)
+    if request.position is not None:
+        invalidate(Commands.GET_PIP_POSITION)
+        position = PIP_POSITION_NAME_TABLE[request.position - 1]
+    else:
+        position = await send_and_parse(handler, Commands.GET_PIP_POSITION)
 
-    return PIPResponse(position=position, size=size)
+    if request.size is not None:
+        invalidate(Commands.GET_PIP_SIZE)
+        size = PIP_SIZE_NAME_TABLE[request.size - 1]
+    else:
+        size = await send_and_parse(handler, Commands.GET_PIP_SIZE)
+
+    return PIPResponse.model_construct(position=position, size=size)
 
 
 # PBP settings endpoints
 @router.get("/pbp", response_model=PBPResponse)
-async def get_pbp_settings() -> PBPResponse:
+async def get_pbp_settings(
+    handler: SerialHandler = Depends(require_available_handler),
+) -> PBPResponse:
     """Get PBP window settings."""
-    _check_device_available()
-    handler = get_serial_handler()
 
-    mode = None
-    aspect = None
-
-    success, response, _ = await handler.send_command(Commands.GET_PBP_MODE)
-    if success and response:
-        mode = ResponseParser.parse_pbp_mode(response)
-
-    success, response, _ = await handler.send_command(Commands.GET_PBP_ASPECT)
-    if success and response:
-        aspect = ResponseParser.parse_aspect(response)
+    mode, aspect = await asyncio.gather(
+        send_and_parse(handler, Commands.GET_PBP_MODE),
+        send_and_parse(handler, Commands.GET_PBP_ASPECT),
+    )
 
-    return PBPResponse(mode=mode, aspect=aspect)
+    return PBPResponse.model_construct(mode=mode, aspect=aspect)
 
 
 @router.post("/pbp", response_model=PBPResponse)
-async def set_pbp_settings(request: SetPBPRequest) -> PBPResponse:
+async def set_pbp_settings(
+    request: SetPBPRequest, handler: SerialHandler = Depends(require_available_handler)
+) -> PBPResponse:
     """Set PBP window settings."""
-    _check_device_available()
-    handler = get_serial_handler()
 
+    commands = []
+    failure_messages = []
     if request.mode is not None:
-        command = Commands.SET_PBP_MODE.format(x=request.mode)
-        success, _, error = await handler.send_command(command)
-        if not success:
-            raise HTTPException(
-                status_code=503,
-                detail=ErrorResponse(
-                    error="command_failed",
-                    message=error or "Failed to set PBP mode",
-                    retry_after=5,
-                ).model_dump(),
-            )
+        commands.append(Commands.FMT_SET_PBP_MODE(request.mode))
+        failure_messages.append("Failed to set PBP mode")
+    if request.aspect is not None:
+        commands.append(Commands.FMT_SET_PBP_ASPECT(request.aspect))
+        failure_messages.append("Failed to set PBP aspect")
 
+    if commands:
+        results = await handler.send_command_batch(commands)
+        for (success, _, error), message in zip(results, failure_messages, strict=True):
+            if not success:
+                raise_command_failed(error or message)
+
+    # The writes either succeeded or raised, so answer from the request and
+    # read only the fields it left unset.
+    if request.mode is not None:
+        invalidate(Commands.GET_PBP_MODE)
     if request.aspect is not None:
-        command = Commands.SET_PBP_ASPECT.format(x=request.aspect)
-        success, _, error = await handler.send_command(command)
-        if not success:
-            raise HTTPException(
-                status_code=503,
-                detail=ErrorResponse(
-                    error="command_failed",
-                    message=error or "Failed to set PBP aspect",
-                    retry_after=5,
-                ).model_dump(),
-            )
+        invalidate(Commands.GET_PBP_ASPECT)
+
+    mode = request.mode
+    if mode is None:
+        mode = await send_and_parse(handler, Commands.GET_PBP_MODE)
 
-    # Get current settings
-    return await get_pbp_settings()
+    aspect = ASPECT_NAME_TABLE[request.aspect - 1] if request.aspect is not None else None
+    if aspect is None:
+        aspect = await send_and_parse(handler, Commands.GET_PBP_ASPECT)
+
+    return PBPResponse.model_construct(mode=mode, aspect=aspect)
 
 
 # Triple screen settings endpoints
 @router.get("/triple", response_model=TripleQuadResponse)
-async def get_triple_settings() -> TripleQuadResponse:
+async def get_triple_settings(
+    handler: SerialHandler = Depends(require_available_handler),
+) -> TripleQuadResponse:
     """Get triple screen settings."""
-    _check_device_available()
-    handler = get_serial_handler()
-
-    mode = None
-    aspect = None
 
-    success, response, _ = await handler.send_command(Commands.GET_TRIPLE_MODE)
-    if success and response:
-        mode = ResponseParser.parse_pbp_mode(response)  # Same format as PBP
-
-    success, response, _ = await handler.send_command(Commands.GET_TRIPLE_ASPECT)
-    if success and response:
-        aspect = ResponseParser.parse_aspect(response)
+    mode, aspect = await asyncio.gather(
+        send_and_parse(handler, Commands.GET_TRIPLE_MODE),
+        send_and_parse(handler, Commands.GET_TRIPLE_ASPECT),
+    )
 
-    return TripleQuadResponse(mode=mode, aspect=aspect)
+    return TripleQuadResponse.model_construct(mode=mode, aspect=aspect)
 
 
 @router.post("/triple", response_model=TripleQuadResponse)
-async def set_triple_settings(request: SetTripleQuadRequest) -> TripleQuadResponse:
+async def set_triple_settings(
+    request: SetTripleQuadRequest, handler: SerialHandler = Depends(require_available_handler)
+) -> TripleQuadResponse:
     """Set triple screen settings."""
-    _check_device_available()
-    handler = get_serial_handler()
 
+    commands = []
+    failure_messages = []
     if request.mode is not None:
-        command = Commands.SET_TRIPLE_MODE.format(x=request.mode)
-        success, _, error = await handler.send_command(command)
-        if not success:
-            raise HTTPException(
-                status_code=503,
-                detail=ErrorResponse(
-                    error="command_failed",
-                    message=error or "Failed to set triple mode",
-                    retry_after=5,
-                ).model_dump(),
-            )
+        commands.append(Commands.FMT_SET_TRIPLE_MODE(request.mode))
+        failure_messages.append("Failed to set triple mode")
+    if request.aspect is not None:
+        commands.append(Commands.FMT_SET_TRIPLE_ASPECT(request.aspect))
+        failure_messages.append("Failed to set triple aspect")
 
+    if commands:
+        results = await handler.send_command_batch(commands)
+        for (success, _, error), message in zip(results, failure_messages, strict=True):
+            if not success:
+                raise_command_failed(error or message)
+
+    # The writes either succeeded or raised, so answer from the request and
+    # read only the fields it left unset.
+    if request.mode is not None:
+        invalidate(Commands.GET_TRIPLE_MODE)
     if request.aspect is not None:
-        command = Commands.SET_TRIPLE_ASPECT.format(x=request.aspect)
-        success, _, error = await handler.send_command(command)
-        if not success:
-            raise HTTPException(
-                status_code=503,
-                detail=ErrorResponse(
-                    error="command_failed",
-                    message=error or "Failed to set triple aspect",
-                    retry_after=5,
-                ).model_dump(),
-            )
+        invalidate(Commands.GET_TRIPLE_ASPECT)
+
+    mode = request.mode
+    if mode is None:
+        mode = await send_and_parse(handler, Commands.GET_TRIPLE_MODE)
 
-    return await get_triple_settings()
+    aspect = ASPECT_NAME_TABLE[request.aspect - 1] if request.aspect is not None else None
+    if aspect is None:
+        aspect = await send_and_parse(handler, Commands.GET_TRIPLE_ASPECT)
+
+    return TripleQuadResponse.model_construct(mode=mode, aspect=aspect)
 
 
 # Quad screen settings endpoints
 @router.get("/quad", response_model=TripleQuadResponse)
-async def get_quad_settings() -> TripleQuadResponse:
+async def get_quad_settings(
+    handler: SerialHandler = Depends(require_available_handler),
+) -> TripleQuadResponse:
     """Get quad screen settings."""
-    _check_device_available()
-    handler = get_serial_handler()
-
-    mode = None
-    aspect = None
 
-    success, response, _ = await handler.send_command(Commands.GET_QUAD_MODE)
-    if success and response:
-        mode = ResponseParser.parse_pbp_mode(response)
-
-    success, response, _ = await handler.send_command(Commands.GET_QUAD_ASPECT)
-    if success and response:
-        aspect = ResponseParser.parse_aspect(response)
+    mode, aspect = await asyncio.gather(
+        send_and_parse(handler, Commands.GET_QUAD_MODE),
+        send_and_parse(handler, Commands.GET_QUAD_ASPECT),
+    )
 
-    return TripleQuadResponse(mode=mode, aspect=aspect)
+    return TripleQuadResponse.model_construct(mode=mode, aspect=aspect)
 
 
 @router.post("/quad", response_model=TripleQuadResponse)
-async def set_quad_settings(request: SetTripleQuadRequest) -> TripleQuadResponse:
+async def set_quad_settings(
+    request: SetTripleQuadRequest, handler: SerialHandler = Depends(require_available_handler)
+) -> TripleQuadResponse:
     """Set quad screen settings."""
-    _check_device_available()
-    handler = get_serial_handler()
 
+    commands = []
+    failure_messages = []
     if request.mode is not None:
-        command = Commands.SET_QUAD_MODE.format(x=request.mode)
-        success, _, error = await handler.send_command(command)
-        if not success:
-            raise HTTPException(
-                status_code=503,
-                detail=ErrorResponse(
-                    error="command_failed",
-                    message=error or "Failed to set quad mode",
-                    retry_after=5,
-                ).model_dump(),
-            )
+        commands.append(Commands.FMT_SET_QUAD_MODE(request.mode))
+        failure_messages.append("Failed to set quad mode")
+    if request.aspect is not None:
+        commands.append(Commands.FMT_SET_QUAD_ASPECT(request.aspect))
+        failure_messages.append("Failed to set quad aspect")
 
+    if commands:
+        results = await handler.send_command_batch(commands)
+        for (success, _, error), message in zip(results, failure_messages, strict=True):
+            if not success:
+                raise_command_failed(error or message)
+
+    # The writes either succeeded or raised, so answer from the request and
+    # read only the fields it left unset.
+    if request.mode is not None:
+        invalidate(Commands.GET_QUAD_MODE)
     if request.aspect is not None:
-        command = Commands.SET_QUAD_ASPECT.format(x=request.aspect)
-        success, _, error = await handler.send_command(command)
-        if not success:
-            raise HTTPException(
-                status_code=503,
-                detail=ErrorResponse(
-                    error="command_failed",
-                    message=error or "Failed to set quad aspect",
-                    retry_after=5,
-                ).model_dump(),
-            )
+        invalidate(Commands.GET_QUAD_ASPECT)
+
+    mode = request.mode
+    if mode is None:
+        mode = await send_and_parse(handler, Commands.GET_QUAD_MODE)
+
+    aspect = ASPECT_NAME_TABLE[request.aspect - 1] if request.aspect is not None else None
+    if aspect is None:
+        aspect = await send_and_parse(handler, Commands.GET_QUAD_ASPECT)
 
-    return await get_quad_settings()
+    return TripleQuadResponse.model_construct(mode=mode, aspect=aspect)
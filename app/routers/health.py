@@ -1,11 +1,12 @@
 """Health check endpoints for Kubernetes probes."""
 
-from datetime import UTC, datetime
+import time
 from typing import Literal
 
+import orjson
 from fastapi import APIRouter, Response
 
-from app.dependencies import get_serial_handler, get_startup_time
+from app.dependencies import get_serial_handler, get_startup_monotonic
 from app.models import ConnectionState, HealthResponse
 
 HealthStatus = Literal["ok", "degraded", "error"]
@@ -14,38 +15,66 @@ router = APIRouter()
 
 
 def _get_uptime_seconds() -> float:
-    """Calculate uptime in seconds."""
-    startup = get_startup_time()
-    return (datetime.now(UTC) - startup).total_seconds()
+    """Calculate uptime in seconds from the monotonic clock."""
+    return time.monotonic() - get_startup_monotonic()
 
 
-@router.get("/healthz/live", response_model=HealthResponse)
-async def liveness_probe(response: Response) -> HealthResponse:
+# Liveness only answers "the process is up", so the body never changes;
+# serialize it once and hand the same bytes to every probe.
+_LIVE_OK_BODY = orjson.dumps({"status": "ok"})
+
+
+@router.get("/healthz/live")
+async def liveness_probe() -> Response:
     """
     Liveness probe for Kubernetes.
 
     Returns 200 if the FastAPI process is running.
     Used by Kubernetes to restart the pod if the process hangs.
+
+    The body is a prebuilt static payload: liveness semantics only need
+    "process is up", so the handler skips pydantic and handler reads.
     """
+    return Response(content=_LIVE_OK_BODY, media_type="application/json")
+
+
+# Probe bursts (service mesh, parallel controllers) within this window
+# share one computed response; only the uptime field is refreshed. The
+# handler runs entirely on the event loop with no awaits, so a plain
+# module tuple is race-free without a lock.
+_READY_TTL = 0.2
+_ready_cached: tuple[float, int, HealthResponse] | None = None
+
+
+def _build_readiness() -> tuple[int, HealthResponse]:
+    """Compute the readiness status code and body from handler state."""
     try:
         handler = get_serial_handler()
-        return HealthResponse(
-            status="ok",
-            serial_connected=handler.is_connected,
-            device_state=ConnectionState(handler.state.value),
-            last_heartbeat=handler.last_heartbeat,
-            uptime_seconds=_get_uptime_seconds(),
-        )
     except RuntimeError:
-        # Handler not initialized yet
-        return HealthResponse(
-            status="ok",
+        # Handler not initialized
+        handler = None
+
+    if handler is None or not handler.is_initialized:
+        return 503, HealthResponse.model_construct(
+            status="error",
             serial_connected=False,
             device_state=ConnectionState.UNAVAILABLE,
             last_heartbeat=None,
             uptime_seconds=_get_uptime_seconds(),
         )
 
+    # Service is ready even if device is disconnected
+    # (we gracefully handle disconnected state)
+    status: HealthStatus = "ok" if handler.is_connected else "degraded"
+
+    return 200, HealthResponse.model_construct(
+        status=status,
+        serial_connected=handler.is_connected,
+        device_state=handler.model_state,
+        last_heartbeat=handler.last_heartbeat,
+        uptime_seconds=_get_uptime_seconds(),
+    )
+
 
 @router.get("/healthz/ready", response_model=HealthResponse)
 async def readiness_probe(response: Response) -> HealthResponse:
@@ -56,38 +85,18 @@ async def readiness_probe(response: Response) -> HealthResponse:
     Returns 503 if still initializing or in a bad state.
     Used by Kubernetes to remove pod from service endpoints during issues.
     """
-    try:
-        handler = get_serial_handler()
-
-        if not handler.is_initialized:
-            response.status_code = 503
-            return HealthResponse(
-                status="error",
-                serial_connected=False,
-                device_state=ConnectionState.UNAVAILABLE,
-                last_heartbeat=None,
-                uptime_seconds=_get_uptime_seconds(),
-            )
-
-        # Service is ready even if device is disconnected
-        # (we gracefully handle disconnected state)
-        status: HealthStatus = "ok" if handler.is_connected else "degraded"
-
-        return HealthResponse(
-            status=status,
-            serial_connected=handler.is_connected,
-            device_state=ConnectionState(handler.state.value),
-            last_heartbeat=handler.last_heartbeat,
-            uptime_seconds=_get_uptime_seconds(),
-        )
-
-    except RuntimeError:
-        # Handler not initialized
-        response.status_code = 503
-        return HealthResponse(
-            status="error",
-            serial_connected=False,
-            device_state=ConnectionState.UNAVAILABLE,
-            last_heartbeat=None,
-            uptime_seconds=_get_uptime_seconds(),
-        )
+    global _ready_cached
+
+    now = time.monotonic()
+    if _ready_cached is not None and now - _ready_cached[0] < _READY_TTL:
+        _, code, cached = _ready_cached
+        cached.uptime_seconds = _get_uptime_seconds()
+        if code != 200:
+            response.status_code = code
+        return cached
+
+    code, body = _build_readiness()
+    if code != 200:
+        response.status_code = code
+    _ready_cached = (now, code, body)
+    return body
@@ -1,70 +1,66 @@
 """Output endpoints: resolution, HDCP, video mode."""
 
-from fastapi import APIRouter, HTTPException
-
-from app.commands import RESOLUTION_NAMES, Commands, OutputResolution, ResponseParser
-from app.dependencies import get_serial_handler
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+
+from app._router_utils import raise_command_failed
+from app.cache import invalidate, send_and_parse
+from app.commands import (
+    HDCP_NAME_TABLE,
+    RESOLUTION_NAME_TABLE,
+    VIDEO_MODE_NAME_TABLE,
+    VKA_NAME_TABLE,
+    Commands,
+)
+from app.dependencies import require_available_handler
 from app.models import (
-    ErrorResponse,
     OutputResponse,
     SetHDCPRequest,
     SetResolutionRequest,
     SetVideoModeRequest,
 )
-from app.serial_handler import ConnectionState
+from app.serial_handler import SerialHandler
 
 router = APIRouter()
 
 
-def _check_device_available() -> None:
-    """Check if device is available, raise HTTPException if not."""
-    handler = get_serial_handler()
-    if handler.state == ConnectionState.UNAVAILABLE:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="device_unavailable",
-                message="Serial device not connected",
-                retry_after=5,
-            ).model_dump(),
-        )
+_INVALID_PATTERN_DETAIL = {
+    "error": "invalid_parameter",
+    "message": "Pattern must be 1 (black) or 2 (blue)",
+}
 
+# The resolution list never changes at runtime; build the payload once.
+_RESOLUTIONS_PAYLOAD = {
+    "resolutions": [
+        {"value": index + 1, "name": name} for index, name in enumerate(RESOLUTION_NAME_TABLE)
+    ]
+}
 
-@router.get("/output", response_model=OutputResponse)
-async def get_output() -> OutputResponse:
-    """Get current output settings (resolution, HDCP, video mode)."""
-    _check_device_available()
-    handler = get_serial_handler()
-
-    resolution = None
-    hdcp = None
-    video_mode = None
-    vka_pattern = None
-
-    # Get resolution
-    success, response, _ = await handler.send_command(Commands.GET_OUTPUT_RES)
-    if success and response:
-        resolution = ResponseParser.parse_resolution(response)
-
-    # Get HDCP
-    success, response, _ = await handler.send_command(Commands.GET_OUTPUT_HDCP)
-    if success and response:
-        hdcp = ResponseParser.parse_hdcp(response)
-
-    # Get video mode (ITC)
-    success, response, _ = await handler.send_command(Commands.GET_OUTPUT_ITC)
-    if success and response:
-        video_mode = ResponseParser.parse_video_mode(response)
-
-    # Get VKA pattern
-    success, response, _ = await handler.send_command(Commands.GET_OUTPUT_VKA)
-    if success and response:
-        if "black" in response.lower():
-            vka_pattern = "black_screen"
-        elif "blue" in response.lower():
-            vka_pattern = "blue_screen"
-
-    return OutputResponse(
+
+async def _output_response(
+    handler: SerialHandler,
+    *,
+    resolution: str | None = None,
+    hdcp: str | None = None,
+    video_mode: str | None = None,
+    vka_pattern: str | None = None,
+) -> OutputResponse:
+    """Build an OutputResponse, reading only the fields the caller does not know.
+
+    Setters pass the value they just wrote; the rest comes from the TTL
+    cache and only falls through to the device when no fresh entry exists.
+    """
+    if resolution is None:
+        resolution = await send_and_parse(handler, Commands.GET_OUTPUT_RES)
+    if hdcp is None:
+        hdcp = await send_and_parse(handler, Commands.GET_OUTPUT_HDCP)
+    if video_mode is None:
+        video_mode = await send_and_parse(handler, Commands.GET_OUTPUT_ITC)
+    if vka_pattern is None:
+        vka_pattern = await send_and_parse(handler, Commands.GET_OUTPUT_VKA)
+    return OutputResponse.model_construct(
         resolution=resolution,
         hdcp=hdcp,
         video_mode=video_mode,
@@ -72,8 +68,33 @@ async def get_output() -> OutputResponse:
     )
 
 
+@router.get("/output", response_model=OutputResponse)
+async def get_output(handler: SerialHandler = Depends(require_available_handler)) -> ORJSONResponse:
+    """Get current output settings (resolution, HDCP, video mode)."""
+
+    # The four reads are independent; gather keeps the event loop free to
+    # overlap parsing with the next wait on the serial lock.
+    resolution, hdcp, video_mode, vka_pattern = await asyncio.gather(
+        send_and_parse(handler, Commands.GET_OUTPUT_RES),
+        send_and_parse(handler, Commands.GET_OUTPUT_HDCP),
+        send_and_parse(handler, Commands.GET_OUTPUT_ITC),
+        send_and_parse(handler, Commands.GET_OUTPUT_VKA),
+    )
+
+    return ORJSONResponse(
+        OutputResponse.model_construct(
+            resolution=resolution,
+            hdcp=hdcp,
+            video_mode=video_mode,
+            vka_pattern=vka_pattern,
+        ).model_dump(mode="json")
+    )
+
+
 @router.post("/output/resolution", response_model=OutputResponse)
-async def set_resolution(request: SetResolutionRequest) -> OutputResponse:
+async def set_resolution(
+    request: SetResolutionRequest, handler: SerialHandler = Depends(require_available_handler)
+) -> OutputResponse:
     """
     Set output resolution.
 
@@ -93,37 +114,27 @@ async def set_resolution(request: SetResolutionRequest) -> OutputResponse:
     - 13: 1280x720p50
     - 14: 1024x768p60
     """
-    _check_device_available()
-    handler = get_serial_handler()
 
-    command = Commands.SET_OUTPUT_RES.format(x=request.resolution)
+    command = Commands.FMT_SET_OUTPUT_RES(request.resolution)
     success, response, error = await handler.send_command(command)
 
     if not success:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="command_failed",
-                message=error or "Failed to set resolution",
-                retry_after=5,
-            ).model_dump(),
-        )
+        raise_command_failed(error or "Failed to set resolution")
 
-    return await get_output()
+    invalidate(Commands.GET_OUTPUT_RES)
+    return await _output_response(handler, resolution=RESOLUTION_NAME_TABLE[request.resolution - 1])
 
 
 @router.get("/output/resolutions")
 async def get_available_resolutions() -> dict:
     """Get list of available output resolutions."""
-    return {
-        "resolutions": [
-            {"value": res.value, "name": RESOLUTION_NAMES[res]} for res in OutputResolution
-        ]
-    }
+    return _RESOLUTIONS_PAYLOAD
 
 
 @router.post("/output/hdcp", response_model=OutputResponse)
-async def set_hdcp(request: SetHDCPRequest) -> OutputResponse:
+async def set_hdcp(
+    request: SetHDCPRequest, handler: SerialHandler = Depends(require_available_handler)
+) -> OutputResponse:
     """
     Set HDCP mode.
 
@@ -131,54 +142,42 @@ async def set_hdcp(request: SetHDCPRequest) -> OutputResponse:
     - 2: HDCP 2.2
     - 3: OFF
     """
-    _check_device_available()
-    handler = get_serial_handler()
 
-    command = Commands.SET_OUTPUT_HDCP.format(x=request.hdcp)
+    command = Commands.FMT_SET_OUTPUT_HDCP(request.hdcp)
     success, response, error = await handler.send_command(command)
 
     if not success:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="command_failed",
-                message=error or "Failed to set HDCP mode",
-                retry_after=5,
-            ).model_dump(),
-        )
+        raise_command_failed(error or "Failed to set HDCP mode")
 
-    return await get_output()
+    invalidate(Commands.GET_OUTPUT_HDCP)
+    return await _output_response(handler, hdcp=HDCP_NAME_TABLE[request.hdcp - 1])
 
 
 @router.post("/output/video-mode", response_model=OutputResponse)
-async def set_video_mode(request: SetVideoModeRequest) -> OutputResponse:
+async def set_video_mode(
+    request: SetVideoModeRequest, handler: SerialHandler = Depends(require_available_handler)
+) -> OutputResponse:
     """
     Set video mode (ITC).
 
     - 1: Video mode
     - 2: PC mode
     """
-    _check_device_available()
-    handler = get_serial_handler()
 
-    command = Commands.SET_OUTPUT_ITC.format(x=request.mode)
+    command = Commands.FMT_SET_OUTPUT_ITC(request.mode)
     success, response, error = await handler.send_command(command)
 
     if not success:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="command_failed",
-                message=error or "Failed to set video mode",
-                retry_after=5,
-            ).model_dump(),
-        )
+        raise_command_failed(error or "Failed to set video mode")
 
-    return await get_output()
+    invalidate(Commands.GET_OUTPUT_ITC)
+    return await _output_response(handler, video_mode=VIDEO_MODE_NAME_TABLE[request.mode - 1])
 
 
 @router.post("/output/vka")
-async def set_vka_pattern(pattern: int) -> OutputResponse:
+async def set_vka_pattern(
+    pattern: int, handler: SerialHandler = Depends(require_available_handler)
+) -> OutputResponse:
     """
     Set video keep active pattern.
 
@@ -188,26 +187,14 @@ async def set_vka_pattern(pattern: int) -> OutputResponse:
     if pattern not in (1, 2):
         raise HTTPException(
             status_code=400,
-            detail=ErrorResponse(
-                error="invalid_parameter",
-                message="Pattern must be 1 (black) or 2 (blue)",
-            ).model_dump(),
+            detail=_INVALID_PATTERN_DETAIL,
         )
 
-    _check_device_available()
-    handler = get_serial_handler()
-
-    command = Commands.SET_OUTPUT_VKA.format(x=pattern)
+    command = Commands.FMT_SET_OUTPUT_VKA(pattern)
     success, response, error = await handler.send_command(command)
 
     if not success:
-        raise HTTPException(
-            status_code=503,
-            detail=ErrorResponse(
-                error="command_failed",
-                message=error or "Failed to set VKA pattern",
-                retry_after=5,
-            ).model_dump(),
-        )
+        raise_command_failed(error or "Failed to set VKA pattern")
 
-    return await get_output()
+    invalidate(Commands.GET_OUTPUT_VKA)
+    return await _output_response(handler, vka_pattern=VKA_NAME_TABLE[pattern - 1])
@@ -2,14 +2,19 @@
 
 import asyncio
 import os
+import random
+import time
 from datetime import UTC, datetime
 from enum import Enum
 
 import serial
-import serial.tools.list_ports
+import serial_asyncio
 import structlog
 from serial import SerialException
 
+from app import models
+from app.commands import Commands, encode_command
+
 log = structlog.get_logger()
 
 
@@ -21,6 +26,15 @@ class ConnectionState(str, Enum):
     ON = "on"  # Device connected and powered on
 
 
+# Handler state -> API model state, precomputed so status and health
+# endpoints read an attribute instead of coercing the enum per request.
+_MODEL_STATE = {state: models.CONNECTION_STATE_BY_VALUE[state.value] for state in ConnectionState}
+
+# Handler state -> raw value string, saving the Enum.value descriptor
+# lookup on per-request paths like get_device_info.
+_STATE_VALUE = {state: state.value for state in ConnectionState}
+
+
 class SerialHandler:
     """Async serial handler with automatic reconnection."""
 
@@ -38,33 +52,82 @@ class SerialHandler:
         self.heartbeat_interval = heartbeat_interval
         self.reconnect_backoff_max = reconnect_backoff_max
 
-        self._serial: serial.Serial | None = None
-        self._lock = asyncio.Lock()
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        # Plain bool mirror of the connection state; is_connected is on the
+        # per-request hot path and a field read beats transport introspection.
+        self._connected = False
+        # Single-consumer command queue: one worker task owns the wire, so
+        # commands serialize with FIFO fairness instead of callers racing
+        # for a lock. Each entry is a command batch plus the future its
+        # caller awaits.
+        self._cmd_queue: asyncio.Queue[tuple[list[str], asyncio.Future]] = asyncio.Queue()
+        self._cmd_worker_task: asyncio.Task | None = None
+        # Single-flight table for read commands: concurrent duplicates of
+        # the same "r ..." command share one wire round trip.
+        self._inflight: dict[str, asyncio.Future] = {}
+        # Single-flight future for get_device_info; see that method.
+        self._device_info_future: asyncio.Future[dict] | None = None
         self._state = ConnectionState.UNAVAILABLE
+        self._model_state = _MODEL_STATE[ConnectionState.UNAVAILABLE]
         self._last_heartbeat: datetime | None = None
+        # isoformat string cached alongside the datetime so per-request
+        # readers don't reformat the same timestamp.
+        self._last_heartbeat_iso: str | None = None
         self._reconnect_task: asyncio.Task | None = None
         self._heartbeat_task: asyncio.Task | None = None
         self._running = False
         self._reconnect_delay = 1.0
         self._initialized = False
 
-        # Cached device state
+        # Two-speed heartbeat: _waiters counts sends that failed since the
+        # port went down (cleared on reconnect). While it is nonzero the
+        # loop ticks at the fast interval, and the event wakes it
+        # immediately, so reconnection isn't gated on the idle cadence.
+        self._min_heartbeat_interval = 0.5
+        self._waiters: int = 0
+        self._heartbeat_wake = asyncio.Event()
+
+        # Cached device state. The power check carries a short TTL so
+        # back-to-back heartbeats and status calls don't re-poll state
+        # that cannot change that fast; power writes invalidate it.
         self._cached_power_state: bool | None = None
+        self._power_cache_ttl = 2.0
+        self._power_cache_expiry: float = 0.0
+
+        # Device identity is immutable per connection; fetched once at
+        # connect and held until disconnect.
+        self._device_type: str | None = None
+        self._firmware: str | None = None
 
     @property
     def state(self) -> ConnectionState:
         """Current connection state."""
         return self._state
 
+    @property
+    def model_state(self) -> models.ConnectionState:
+        """API-facing connection state, kept in sync by _set_state."""
+        return self._model_state
+
+    def _set_state(self, state: ConnectionState) -> None:
+        """Update the connection state and its precomputed API mirror."""
+        self._state = state
+        self._model_state = _MODEL_STATE[state]
+
     @property
     def last_heartbeat(self) -> datetime | None:
         """Last successful heartbeat timestamp."""
         return self._last_heartbeat
 
+    # How long the reader waits for another line once the device has
+    # started answering; the device is considered done when it goes idle.
+    _IDLE_TIMEOUT = 0.05
+
     @property
     def is_connected(self) -> bool:
         """Whether the serial port is connected."""
-        return self._serial is not None and self._serial.is_open
+        return self._connected
 
     @property
     def is_initialized(self) -> bool:
@@ -80,7 +143,8 @@ class SerialHandler:
         await self._try_connect()
         self._initialized = True
 
-        # Start heartbeat task
+        # Start command worker and heartbeat tasks
+        self._cmd_worker_task = asyncio.create_task(self._cmd_worker())
         self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
         log.info("serial_handler_started", state=self._state)
 
@@ -88,6 +152,13 @@ class SerialHandler:
         """Stop the serial handler."""
         self._running = False
 
+        if self._cmd_worker_task:
+            self._cmd_worker_task.cancel()
+            try:
+                await self._cmd_worker_task
+            except asyncio.CancelledError:
+                pass
+
         if self._heartbeat_task:
             self._heartbeat_task.cancel()
             try:
@@ -110,93 +181,174 @@ class SerialHandler:
         # Check if port exists
         if not os.path.exists(self.port):
             log.debug("serial_port_not_found", port=self.port)
-            self._state = ConnectionState.UNAVAILABLE
+            self._set_state(ConnectionState.UNAVAILABLE)
             return False
 
         try:
-            self._serial = serial.Serial(
-                port=self.port,
+            reader, writer = await serial_asyncio.open_serial_connection(
+                url=self.port,
                 baudrate=self.baud_rate,
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE,
-                timeout=self.timeout,
-                write_timeout=self.timeout,
             )
+            self._reader = reader
+            self._writer = writer
 
-            # Clear any stale data
-            self._serial.reset_input_buffer()
-            self._serial.reset_output_buffer()
+            # Clear any stale data on the underlying port
+            port = getattr(writer.transport, "serial", None)
+            if port is not None:
+                port.reset_input_buffer()
+                port.reset_output_buffer()
 
             log.info("serial_connected", port=self.port)
 
+            # The connect sequence talks to the wire directly; _connected
+            # stays False until it finishes so the command worker keeps
+            # fast-failing queued commands instead of interleaving reads
+            # with ours on the same stream.
+
             # Check power state to determine if device is on or off
             await self._check_power_state()
 
-            # Reset reconnect delay on successful connection
+            # Fetch immutable device identity once per connection
+            await self._read_device_identity()
+
+            # Reset reconnect delay and outage demand on successful
+            # connection; the heartbeat drops back to its idle cadence.
             self._reconnect_delay = 1.0
+            self._waiters = 0
+            self._connected = True
 
             return True
 
         except SerialException as e:
             log.warning("serial_connection_failed", port=self.port, error=str(e))
-            self._state = ConnectionState.UNAVAILABLE
+            self._connected = False
+            self._set_state(ConnectionState.UNAVAILABLE)
             return False
 
     async def _disconnect(self) -> None:
         """Disconnect from the serial port."""
-        if self._serial and self._serial.is_open:
+        self._connected = False
+        if self._writer is not None and not self._writer.is_closing():
             try:
-                self._serial.close()
+                self._writer.close()
             except Exception as e:
                 log.warning("serial_close_error", error=str(e))
 
-        self._serial = None
-        self._state = ConnectionState.UNAVAILABLE
+        self._reader = None
+        self._writer = None
+        self._set_state(ConnectionState.UNAVAILABLE)
         self._cached_power_state = None
+        # Expire the power snapshot so the next connect re-reads the
+        # device instead of trusting pre-disconnect state.
+        self._power_cache_expiry = 0.0
+        self._device_type = None
+        self._firmware = None
         log.info("serial_disconnected")
 
-    async def _check_power_state(self) -> None:
-        """Check the device power state and update connection state."""
+    async def _read_device_identity(self) -> None:
+        """Cache the device type and firmware version for this connection.
+
+        Connect sequence only: talks to the wire directly, relying on the
+        worker being parked while _connected is False.
+        """
         try:
-            response = await self._send_command_internal("r power!")
+            response = await self._send_command_internal("r type!")
+            if response:
+                self._device_type = response.strip()
+
+            response = await self._send_command_internal("r fw version!")
             if response:
-                if "power on" in response.lower():
-                    self._state = ConnectionState.ON
-                    self._cached_power_state = True
-                elif "power off" in response.lower():
-                    self._state = ConnectionState.OFF
-                    self._cached_power_state = False
-                else:
-                    # Got a response but couldn't parse power state
-                    self._state = ConnectionState.ON
-                    self._cached_power_state = None
-                self._last_heartbeat = datetime.now(UTC)
+                self._firmware = response.strip()
+        except Exception as e:
+            log.warning("device_identity_read_failed", error=str(e))
+
+    def _apply_power_response(self, response: str | None) -> None:
+        """Update connection and power state from an "r power!" response."""
+        if response:
+            if "power on" in response.lower():
+                self._set_state(ConnectionState.ON)
+                self._cached_power_state = True
+            elif "power off" in response.lower():
+                self._set_state(ConnectionState.OFF)
+                self._cached_power_state = False
             else:
-                self._state = ConnectionState.UNAVAILABLE
+                # Got a response but couldn't parse power state
+                self._set_state(ConnectionState.ON)
+                self._cached_power_state = None
+            self._last_heartbeat = datetime.now(UTC)
+            self._last_heartbeat_iso = self._last_heartbeat.isoformat()
+            self._power_cache_expiry = time.monotonic() + self._power_cache_ttl
+        else:
+            self._set_state(ConnectionState.UNAVAILABLE)
+
+    async def _check_power_state(self) -> None:
+        """Check the device power state and update connection state.
+
+        Connect sequence only: talks to the wire directly, relying on the
+        worker being parked while _connected is False. Once connected,
+        the heartbeat uses _heartbeat_power_check instead.
+        """
+        if time.monotonic() < self._power_cache_expiry:
+            return
+
+        try:
+            response = await self._send_command_internal("r power!")
+            self._apply_power_response(response)
         except Exception as e:
             log.warning("power_state_check_failed", error=str(e))
-            self._state = ConnectionState.UNAVAILABLE
+            self._set_state(ConnectionState.UNAVAILABLE)
+
+    async def _heartbeat_power_check(self) -> None:
+        """Power check routed through the command queue.
+
+        The worker owns the wire while connected; sending through the
+        queue (with read dedupe) keeps the heartbeat from racing an
+        in-flight worker read on the same stream.
+        """
+        if time.monotonic() < self._power_cache_expiry:
+            return
+
+        success, response, _ = await self.send_command("r power!")
+        self._apply_power_response(response if success else None)
 
     async def _heartbeat_loop(self) -> None:
-        """Periodic heartbeat to verify device connectivity."""
+        """Periodic heartbeat to verify device connectivity.
+
+        Sleeps on a wakeable event: failed sends set it so a disconnect
+        is noticed immediately, and while an outage has seen failed
+        sends the loop ticks at _min_heartbeat_interval instead of the
+        idle heartbeat_interval until a connection lands.
+        """
         while self._running:
             try:
-                await asyncio.sleep(self.heartbeat_interval)
+                interval = (
+                    self._min_heartbeat_interval if self._waiters else self.heartbeat_interval
+                )
+                try:
+                    await asyncio.wait_for(self._heartbeat_wake.wait(), timeout=interval)
+                except TimeoutError:
+                    pass
+                self._heartbeat_wake.clear()
 
                 if not self._running:
                     break
 
                 if self.is_connected:
-                    # Send heartbeat
-                    await self._check_power_state()
+                    # Send heartbeat through the command queue
+                    await self._heartbeat_power_check()
 
                     if self._state == ConnectionState.UNAVAILABLE:
                         log.warning("heartbeat_failed_disconnecting")
                         await self._disconnect()
                         self._schedule_reconnect()
-                else:
-                    # Try to reconnect
+                elif not (self._reconnect_task and not self._reconnect_task.done()):
+                    # Try to reconnect, but only if the dedicated
+                    # reconnect task isn't already running: two
+                    # concurrent _try_connect calls can clobber each
+                    # other's freshly opened connection.
                     await self._try_reconnect()
 
             except asyncio.CancelledError:
@@ -224,85 +376,225 @@ class SerialHandler:
                 log.info("reconnection_successful", port=self.port)
                 return
 
-            # Exponential backoff
-            await asyncio.sleep(self._reconnect_delay)
+            # Exponential backoff with full jitter so replicas watching the
+            # same device desynchronize their retry storms
+            await asyncio.sleep(random.uniform(0, self._reconnect_delay))
             self._reconnect_delay = min(self._reconnect_delay * 2, self.reconnect_backoff_max)
 
     async def _send_command_internal(self, command: str) -> str | None:
         """Send command without lock (internal use only)."""
-        if not self._serial or not self._serial.is_open:
+        if self._reader is None or self._writer is None or self._writer.is_closing():
             return None
 
         try:
-            # Ensure command ends with newline for consistency
-            if not command.endswith("\r\n"):
-                command = command.rstrip("\r\n") + "\r\n"
-
-            # Send command
-            self._serial.write(command.encode("ascii"))
-            self._serial.flush()
+            # Send the cached CRLF-terminated wire form of the command
+            self._writer.write(encode_command(command))
+            await self._writer.drain()
+
+            # Read response lines as they arrive: the first may take up to
+            # the full command timeout, then the response is complete once
+            # the device goes idle. No fixed sleeps on the hot path. Lines
+            # stay as bytes until the single decode at the end, so each
+            # line costs one strip instead of a decode plus a strip.
+            response_lines: list[bytes] = []
+            read_timeout = self.timeout
+            while True:
+                try:
+                    raw_line = await asyncio.wait_for(self._reader.readline(), timeout=read_timeout)
+                except TimeoutError:
+                    break
 
-            # Read response (may be multiple lines)
-            await asyncio.sleep(0.1)  # Give device time to respond
+                if not raw_line:
+                    # EOF: the port went away under us
+                    break
 
-            response_lines = []
-            while self._serial.in_waiting > 0:
-                line = self._serial.readline().decode("ascii", errors="ignore").strip()
+                line = raw_line.strip()
                 if line:
                     response_lines.append(line)
-                await asyncio.sleep(0.05)
+                read_timeout = self._IDLE_TIMEOUT
 
-            response = "\n".join(response_lines)
-            return response if response else None
+            if not response_lines:
+                return None
+            return b"\n".join(response_lines).decode("ascii", errors="ignore")
 
-        except SerialException as e:
+        except (SerialException, OSError) as e:
             log.error("serial_write_error", error=str(e))
             return None
         except Exception as e:
             log.error("command_error", error=str(e))
             return None
 
-    async def send_command(self, command: str) -> tuple[bool, str | None, str | None]:
-        """
-        Send a command to the device.
+    async def _cmd_worker(self) -> None:
+        """Single consumer of the command queue.
 
-        Returns:
-            Tuple of (success, response, error_message)
+        Sole owner of the wire while connected; during a connect sequence
+        _connected is False, so the worker fast-fails queued commands and
+        the connect path reads the stream alone.
         """
-        async with self._lock:
-            if not self.is_connected:
-                return False, None, "device_unavailable"
-
+        while True:
+            commands, fut = await self._cmd_queue.get()
+            try:
+                results = await self._execute_commands(commands)
+                if not fut.done():
+                    fut.set_result(results)
+            except asyncio.CancelledError:
+                if not fut.done():
+                    fut.set_exception(asyncio.CancelledError())
+                raise
+            except Exception as e:
+                if not fut.done():
+                    fut.set_exception(e)
+            finally:
+                self._cmd_queue.task_done()
+
+    async def _execute_commands(
+        self, commands: list[str]
+    ) -> list[tuple[bool, str | None, str | None]]:
+        """Run a command batch on the wire (worker task only)."""
+        if not self.is_connected:
+            # Record demand so the heartbeat keeps the fast cadence for
+            # the rest of the outage, and wake it now; the counter is
+            # cleared when a connection lands.
+            self._waiters += 1
+            self._heartbeat_wake.set()
+            return [(False, None, "device_unavailable")] * len(commands)
+
+        results: list[tuple[bool, str | None, str | None]] = []
+        for command in commands:
             log.debug("sending_command", command=command.strip())
-
             response = await self._send_command_internal(command)
 
             if response is None:
-                # Connection might have been lost
+                # Connection might have been lost; fail the remainder
                 await self._disconnect()
                 self._schedule_reconnect()
-                return False, None, "device_communication_error"
+                results.append((False, None, "device_communication_error"))
+                results.extend(
+                    (False, None, "device_unavailable") for _ in commands[len(results) :]
+                )
+                break
 
             log.debug("received_response", response=response)
-            return True, response, None
+            if command in (Commands.POWER_ON, Commands.POWER_OFF):
+                # Power writes invalidate the heartbeat's power snapshot
+                self._power_cache_expiry = 0.0
+            results.append((True, response, None))
+
+        return results
+
+    async def _enqueue(self, commands: list[str]) -> list[tuple[bool, str | None, str | None]]:
+        """Hand a batch to the worker and wait for its results."""
+        fut: asyncio.Future[
+            list[tuple[bool, str | None, str | None]]
+        ] = asyncio.get_running_loop().create_future()
+        await self._cmd_queue.put((commands, fut))
+        return await fut
+
+    async def send_command(self, command: str) -> tuple[bool, str | None, str | None]:
+        """
+        Send a command to the device.
+
+        Concurrent duplicates of a read command ("r ...") share a single
+        wire round trip via the inflight table; write commands always go
+        to the device.
+
+        Returns:
+            Tuple of (success, response, error_message)
+        """
+        inflight = command.startswith("r ")
+        if inflight:
+            existing = self._inflight.get(command)
+            if existing is not None:
+                result: tuple[bool, str | None, str | None] = await asyncio.shield(existing)
+                return result
+            fut: asyncio.Future[
+                tuple[bool, str | None, str | None]
+            ] = asyncio.get_running_loop().create_future()
+            self._inflight[command] = fut
+
+        try:
+            results = await self._enqueue([command])
+        except BaseException as e:
+            if inflight:
+                self._inflight.pop(command, None)
+                if not fut.done():
+                    fut.set_exception(e)
+                    # Consumed by any duplicate awaiting the future
+                    fut.exception()
+            raise
+
+        if inflight:
+            self._inflight.pop(command, None)
+            if not fut.done():
+                fut.set_result(results[0])
+        return results[0]
+
+    async def send_command_batch(
+        self, commands: list[str]
+    ) -> list[tuple[bool, str | None, str | None]]:
+        """
+        Send several commands as one queue entry.
+
+        The wire stays half-duplex, but a batch travels through the worker
+        as a unit, so its writes stay back-to-back with no interleaving.
+
+        Returns:
+            One (success, response, error_message) tuple per command, in order.
+        """
+        return await self._enqueue(commands)
 
     async def get_device_info(self) -> dict:
-        """Get device information."""
+        """Get device information.
+
+        Single-flight: callers racing while a lookup is in progress (N
+        status requests right after a reconnect) share one result instead
+        of issuing N identity re-fetches.
+        """
+        existing = self._device_info_future
+        if existing is not None:
+            result: dict = await asyncio.shield(existing)
+            return result
+
+        fut: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
+        self._device_info_future = fut
+        try:
+            info = await self._build_device_info()
+        except BaseException as e:
+            if not fut.done():
+                fut.set_exception(e)
+                # Consumed by any duplicate awaiting the future
+                fut.exception()
+            raise
+        finally:
+            self._device_info_future = None
+
+        if not fut.done():
+            fut.set_result(info)
+        return info
+
+    async def _build_device_info(self) -> dict:
+        """Assemble the device info dict, re-fetching identity if needed."""
         info = {
-            "connection": self._state.value,
+            "connection": _STATE_VALUE[self._state],
             "port": self.port,
-            "last_heartbeat": self._last_heartbeat.isoformat() if self._last_heartbeat else None,
+            "last_heartbeat": self._last_heartbeat_iso,
         }
 
         if self.is_connected and self._state != ConnectionState.UNAVAILABLE:
-            # Get device type
-            success, response, _ = await self.send_command("r type!")
-            if success and response:
-                info["device_type"] = response.strip()
-
-            # Get firmware version
-            success, response, _ = await self.send_command("r fw version!")
-            if success and response:
-                info["firmware"] = response.strip()
+            # Identity is normally cached at connect time; if that read
+            # failed, re-fetch both fields as one queue batch so they
+            # travel back-to-back on the wire instead of two round trips
+            # with worker handoffs in between.
+            if self._device_type is None or self._firmware is None:
+                type_result, fw_result = await self.send_command_batch(["r type!", "r fw version!"])
+                if type_result[0] and type_result[1]:
+                    self._device_type = type_result[1].strip()
+                if fw_result[0] and fw_result[1]:
+                    self._firmware = fw_result[1].strip()
+
+            if self._device_type is not None:
+                info["device_type"] = self._device_type
+            if self._firmware is not None:
+                info["firmware"] = self._firmware
 
         return info
@@ -7,13 +7,25 @@ from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
 
-VERSION_FILES = [
-    ("VERSION", r"^(\d+\.\d+\.\d+)$", "{version}"),
-    ("app/__init__.py", r'__version__ = "(\d+\.\d+\.\d+)"', '__version__ = "{version}"'),
-    ("pyproject.toml", r'^version = "(\d+\.\d+\.\d+)"', 'version = "{version}"'),
-    ("chart/Chart.yaml", r"^version: (\d+\.\d+\.\d+)$", "version: {version}"),
-    ("chart/Chart.yaml", r'^appVersion: "(\d+\.\d+\.\d+)"$', 'appVersion: "{version}"'),
-]
+
+def _compile(pattern: str) -> re.Pattern:
+    """Compile a version pattern, in multiline mode if it anchors on ^."""
+    return re.compile(pattern, re.MULTILINE if pattern.startswith("^") else 0)
+
+
+# Substitutions grouped per file so each file is read and written once
+# (Chart.yaml carries two version fields); patterns compile once at import.
+VERSION_FILES: dict[str, list[tuple[re.Pattern, str]]] = {
+    "VERSION": [(_compile(r"^(\d+\.\d+\.\d+)$"), "{version}")],
+    "app/__init__.py": [
+        (_compile(r'__version__ = "(\d+\.\d+\.\d+)"'), '__version__ = "{version}"')
+    ],
+    "pyproject.toml": [(_compile(r'^version = "(\d+\.\d+\.\d+)"'), 'version = "{version}"')],
+    "chart/Chart.yaml": [
+        (_compile(r"^version: (\d+\.\d+\.\d+)$"), "version: {version}"),
+        (_compile(r'^appVersion: "(\d+\.\d+\.\d+)"$'), 'appVersion: "{version}"'),
+    ],
+}
 
 
 def get_current_version() -> str:
@@ -44,25 +56,26 @@ def bump_version(current: str, bump_type: str) -> str:
         raise ValueError(f"Invalid bump type: {bump_type}. Use: major, minor, patch")
 
 
-def update_file(filepath: str, pattern: str, replacement: str, new_version: str) -> bool:
-    """Update version in a file."""
+def update_file(filepath: str, subs: list[tuple[re.Pattern, str]], new_version: str) -> bool:
+    """Apply all version substitutions for one file in a single pass."""
     full_path = PROJECT_ROOT / filepath
     if not full_path.exists():
         print(f"  Warning: {filepath} not found, skipping")
         return False
 
     content = full_path.read_text()
-    new_replacement = replacement.format(version=new_version)
-
-    # Use multiline mode for patterns that match line start
-    flags = re.MULTILINE if pattern.startswith("^") else 0
-    new_content, count = re.subn(pattern, new_replacement, content, flags=flags)
-
-    if count == 0:
-        print(f"  Warning: Pattern not found in {filepath}")
+    updated = False
+    for pattern, replacement in subs:
+        content, count = pattern.subn(replacement.format(version=new_version), content)
+        if count == 0:
+            print(f"  Warning: Pattern not found in {filepath}")
+        else:
+            updated = True
+
+    if not updated:
         return False
 
-    full_path.write_text(new_content)
+    full_path.write_text(content)
     print(f"  Updated {filepath}")
     return True
 
@@ -94,17 +107,17 @@ def main():
     print()
 
     # Update all files
-    for filepath, pattern, replacement in VERSION_FILES:
-        update_file(filepath, pattern, replacement, new_version)
+    for filepath, subs in VERSION_FILES.items():
+        update_file(filepath, subs, new_version)
 
     print()
     print(f"Version bumped to {new_version}")
     print()
     print("Next steps:")
-    print(f"  git add -A")
+    print("  git add -A")
     print(f"  git commit -m 'chore: bump version to {new_version}'")
     print(f"  git tag v{new_version}")
-    print(f"  git push origin main --tags")
+    print("  git push origin main --tags")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 """Generate OpenAPI specification from FastAPI app."""
 
-import json
 import sys
 from pathlib import Path
 
+import orjson
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -19,8 +20,10 @@ def main():
     output_path = Path(__file__).parent.parent / "docs" / "openapi.json"
     output_path.parent.mkdir(exist_ok=True)
 
-    with open(output_path, "w") as f:
-        json.dump(openapi_spec, f, indent=2)
+    # Sorted keys keep the generated file diff-stable across runs
+    output_path.write_bytes(
+        orjson.dumps(openapi_spec, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    )
 
     print(f"OpenAPI spec written to {output_path}")
 
@@ -1,18 +1,27 @@
 """Tests for API endpoints."""
 
-import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
 
+import pytest
 from fastapi.testclient import TestClient
 
+from app import cache, dependencies
+from app.dependencies import set_serial_handler, set_startup_time
+
+# Importing app.main builds every route and pydantic model; do it once at
+# module import. The lifespan never runs here, so no serial I/O happens.
+from app.main import app
+from app.routers import audio, health
+
 
-# Mock the serial handler before importing the app
 @pytest.fixture
 def mock_serial_handler():
     """Create a mock serial handler."""
     handler = MagicMock()
     handler.state = MagicMock()
     handler.state.value = "on"
+    handler.model_state = "on"
     handler.is_connected = True
     handler.is_initialized = True
     handler.last_heartbeat = None
@@ -23,14 +32,18 @@ def mock_serial_handler():
 
 @pytest.fixture
 def client(mock_serial_handler):
-    """Create a test client with mocked dependencies."""
-    from app.dependencies import set_serial_handler, set_startup_time
-    from datetime import datetime, timezone
-
-    set_startup_time(datetime.now(timezone.utc))
+    """Create a test client with mocked dependencies.
+
+    Resets every piece of module-level state the app accumulates between
+    requests so tests can't leak results into each other.
+    """
+    cache.clear()
+    health._ready_cached = None
+    audio._audio_state.update(source=None, volume=None, muted=None)
+    dependencies._last_available = 0.0
+    set_startup_time(datetime.now(UTC))
     set_serial_handler(mock_serial_handler)
 
-    from app.main import app
     return TestClient(app)
 
 
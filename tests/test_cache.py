@@ -0,0 +1,75 @@
+"""Tests for the short-TTL serial read cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app import cache
+from app.commands import Commands
+
+
+@pytest.fixture
+def handler():
+    """A mock handler whose reads always succeed."""
+    h = MagicMock()
+    h.is_connected = True
+    h.send_command = AsyncMock(return_value=(True, "power on", None))
+    return h
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    """Each test starts with an empty cache."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestCachedSend:
+    """Test TTL caching and invalidation of read commands."""
+
+    async def test_fresh_entry_served_without_resend(self, handler):
+        first = await cache.cached_send(handler, Commands.GET_POWER)
+        second = await cache.cached_send(handler, Commands.GET_POWER)
+
+        assert first == second == (True, "power on", None)
+        assert handler.send_command.await_count == 1
+
+    async def test_invalidate_forces_reread(self, handler):
+        await cache.cached_send(handler, Commands.GET_POWER)
+        cache.invalidate(Commands.GET_POWER)
+        await cache.cached_send(handler, Commands.GET_POWER)
+
+        assert handler.send_command.await_count == 2
+
+    async def test_expired_entry_rereads(self, handler):
+        await cache.cached_send(handler, Commands.GET_POWER, ttl=0.0)
+        await cache.cached_send(handler, Commands.GET_POWER, ttl=0.0)
+
+        assert handler.send_command.await_count == 2
+
+    async def test_failures_are_not_cached(self, handler):
+        handler.send_command = AsyncMock(return_value=(False, None, "device_unavailable"))
+
+        await cache.cached_send(handler, Commands.GET_POWER)
+        await cache.cached_send(handler, Commands.GET_POWER)
+
+        assert handler.send_command.await_count == 2
+
+    async def test_commands_are_cached_independently(self, handler):
+        await cache.cached_send(handler, Commands.GET_POWER)
+        await cache.cached_send(handler, Commands.GET_AUDIO_VOL)
+
+        assert handler.send_command.await_count == 2
+
+
+class TestSendAndParse:
+    """Test the parse-dispatching wrapper."""
+
+    async def test_parses_through_the_dispatch_table(self, handler):
+        assert await cache.send_and_parse(handler, Commands.GET_POWER) is True
+
+    async def test_failure_returns_none(self, handler):
+        handler.send_command = AsyncMock(return_value=(False, None, "device_unavailable"))
+
+        assert await cache.send_and_parse(handler, Commands.GET_POWER) is None
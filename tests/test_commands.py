@@ -1,6 +1,5 @@
 """Tests for command parsing."""
 
-import pytest
 
 from app.commands import ResponseParser
 
@@ -57,6 +56,8 @@ class TestResponseParser:
         """Test parsing resolution response."""
         assert ResponseParser.parse_resolution("out resolution: 3840x2160p60") == "3840x2160p60"
         assert ResponseParser.parse_resolution("resolution: 1920x1080p60") == "1920x1080p60"
+        # Mixed-case names keep the device's casing
+        assert ResponseParser.parse_resolution("out Resolution: 1920x1200p60RB") == "1920x1200p60RB"
 
     def test_parse_hdcp(self):
         """Test parsing HDCP response."""
@@ -84,6 +85,28 @@ class TestResponseParser:
         assert ResponseParser.parse_window_input("HDMI 3") == 3
         assert ResponseParser.parse_window_input("HDMI 4") == 4
 
+    def test_parse_all_window_inputs(self):
+        """Test parsing the bulk window input response."""
+        response = (
+            "window 1 select HDMI 1\n"
+            "window 2 select HDMI 3\n"
+            "window 3 select HDMI 2\n"
+            "window 4 select HDMI 4"
+        )
+        assert ResponseParser.parse_all_window_inputs(response) == (
+            (1, 1),
+            (2, 3),
+            (3, 2),
+            (4, 4),
+        )
+        assert ResponseParser.parse_all_window_inputs("garbage") == ()
+
+    def test_parse_vka(self):
+        """Test parsing VKA pattern response."""
+        assert ResponseParser.parse_vka("out vka black screen") == "black_screen"
+        assert ResponseParser.parse_vka("out vka blue screen") == "blue_screen"
+        assert ResponseParser.parse_vka("garbage") is None
+
     def test_parse_aspect(self):
         """Test parsing aspect ratio response."""
         assert ResponseParser.parse_aspect("full screen") == "full_screen"
@@ -0,0 +1,156 @@
+"""Tests for the serial handler's command queue and single-flight dedupe."""
+
+import asyncio
+from contextlib import suppress
+
+import pytest
+
+from app.serial_handler import ConnectionState, SerialHandler
+
+
+@pytest.fixture
+async def handler():
+    """A handler with the command worker running and a fake connection.
+
+    No serial port is opened; tests stub _send_command_internal and
+    exercise the queue/dedupe machinery above it.
+    """
+    h = SerialHandler(port="/dev/null")
+    h._connected = True
+    h._cmd_worker_task = asyncio.create_task(h._cmd_worker())
+
+    yield h
+
+    h._cmd_worker_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await h._cmd_worker_task
+    if h._reconnect_task:
+        with suppress(asyncio.CancelledError):
+            await h._reconnect_task
+
+
+class TestCommandQueue:
+    """Test the queue worker's batching semantics."""
+
+    async def test_batch_results_in_order(self, handler):
+        """A batch returns one success tuple per command, in order."""
+
+        async def fake_send(command):
+            return f"ack {command}"
+
+        handler._send_command_internal = fake_send
+
+        results = await handler.send_command_batch(["r power!", "r type!", "r fw version!"])
+
+        assert results == [
+            (True, "ack r power!", None),
+            (True, "ack r type!", None),
+            (True, "ack r fw version!", None),
+        ]
+
+    async def test_batch_failure_fails_remainder(self, handler):
+        """A mid-batch failure fails that command and all following ones."""
+
+        async def fake_send(command):
+            return "ok" if command == "r power!" else None
+
+        handler._send_command_internal = fake_send
+
+        results = await handler.send_command_batch(["r power!", "r type!", "r fw version!"])
+
+        assert results == [
+            (True, "ok", None),
+            (False, None, "device_communication_error"),
+            (False, None, "device_unavailable"),
+        ]
+        assert not handler.is_connected
+
+    async def test_disconnected_fails_whole_batch(self, handler):
+        """With no connection, every command fails without touching the wire."""
+        handler._connected = False
+
+        async def fake_send(command):  # pragma: no cover - must not run
+            raise AssertionError("wire should not be touched")
+
+        handler._send_command_internal = fake_send
+
+        results = await handler.send_command_batch(["r power!", "r type!"])
+
+        assert results == [(False, None, "device_unavailable")] * 2
+        # Failed sends signal the heartbeat to hurry the reconnect
+        assert handler._waiters == 1
+        assert handler._heartbeat_wake.is_set()
+
+
+class TestSingleFlight:
+    """Test inflight dedupe of concurrent duplicate reads."""
+
+    async def test_concurrent_duplicate_reads_share_one_send(self, handler):
+        calls = []
+
+        async def fake_send(command):
+            calls.append(command)
+            await asyncio.sleep(0)
+            return "power on"
+
+        handler._send_command_internal = fake_send
+
+        first, second = await asyncio.gather(
+            handler.send_command("r power!"),
+            handler.send_command("r power!"),
+        )
+
+        assert calls == ["r power!"]
+        assert first == second == (True, "power on", None)
+
+    async def test_writes_are_never_deduped(self, handler):
+        calls = []
+
+        async def fake_send(command):
+            calls.append(command)
+            await asyncio.sleep(0)
+            return "power on"
+
+        handler._send_command_internal = fake_send
+
+        await asyncio.gather(
+            handler.send_command("power 1!"),
+            handler.send_command("power 1!"),
+        )
+
+        assert calls == ["power 1!", "power 1!"]
+
+    async def test_heartbeat_check_shares_the_queue_with_api_reads(self, handler):
+        """The heartbeat power check rides the queue and dedupes with reads."""
+        calls = []
+
+        async def fake_send(command):
+            calls.append(command)
+            await asyncio.sleep(0)
+            return "power on"
+
+        handler._send_command_internal = fake_send
+        handler._power_cache_expiry = 0.0
+
+        await asyncio.gather(
+            handler._heartbeat_power_check(),
+            handler.send_command("r power!"),
+        )
+
+        assert calls == ["r power!"]
+        assert handler.state is ConnectionState.ON
+
+    async def test_inflight_entry_cleared_after_completion(self, handler):
+        calls = []
+
+        async def fake_send(command):
+            calls.append(command)
+            return "response"
+
+        handler._send_command_internal = fake_send
+
+        await handler.send_command("r type!")
+        assert handler._inflight == {}
+        await handler.send_command("r type!")
+
+        assert calls == ["r type!", "r type!"]